@@ -1,30 +1,203 @@
+import hashlib
 import math
+import mmap
+import os
 import shutil
+import signal
 import struct
 import subprocess
 import tempfile
 import threading
 import time
 import wave
+from collections import deque
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy renderer is used instead
+    njit = None
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # optional; OSError when PortAudio itself is missing
+    sd = None
+
+
+Segment = Tuple[Tuple[float, ...], float, float]
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _render_segment_nb(freqs, frames, fade_frames, volume, start_phase, sample_rate, out):
+        """Compiled per-sample renderer; fills the int16 `out` buffer in place."""
+        two_pi = 2.0 * math.pi
+        # Averaging over freqs, volume, 0.8 headroom and int16 full scale in one factor
+        scale = volume * 0.8 * 32767 / len(freqs)
+        for i in range(frames):
+            t = i / sample_rate
+            sample = 0.0
+            for f in freqs:
+                sample += math.sin(two_pi * f * t + start_phase)
+            # Distance to the nearest edge, capped at the fade length, drives
+            # both fade-in and fade-out without branching.
+            ramp = min(i, frames - i, fade_frames)
+            envelope = math.sin(ramp / fade_frames * (math.pi / 2))
+            # No clamp needed: |value| <= volume * 0.8 <= 1 (checked in AudioEngine)
+            # Round half to even like np.rint; int() would truncate toward zero
+            out[i] = round(sample * envelope * scale)
+
+else:
+    _render_segment_nb = None
+
+
+def _wav_header(n_frames: int, sample_rate: int) -> bytes:
+    """Canonical 44-byte header for mono 16-bit PCM with a known frame count."""
+    data_size = n_frames * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        1,  # mono
+        sample_rate,
+        sample_rate * 2,  # byte rate
+        2,  # block align
+        16,  # bits per sample
+        b"data",
+        data_size,
+    )
+
+
+class _SpawnedPlayer:
+    """Minimal Popen stand-in for a player launched with os.posix_spawn."""
+
+    def __init__(self, pid: int, args: List[str]) -> None:
+        self.pid = pid
+        self.args = args
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                # Already reaped by another waiter
+                self.returncode = 0
+            else:
+                if pid:
+                    self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if timeout is None:
+            if self.returncode is None:
+                try:
+                    _, status = os.waitpid(self.pid, 0)
+                    self.returncode = os.waitstatus_to_exitcode(status)
+                except ChildProcessError:
+                    self.returncode = 0
+            return self.returncode
+        deadline = time.monotonic() + timeout
+        delay = 0.0005
+        while self.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.05)
+        return self.returncode
+
+    def _signal(self, sig: int) -> None:
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self) -> None:
+        self._signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self._signal(signal.SIGKILL)
+
+
+PlayerProcess = Union[subprocess.Popen, _SpawnedPlayer]
+
+
+class _Voice:
+    """One clip being mixed into the output stream."""
+
+    __slots__ = ("samples", "pos", "loop", "done", "generation")
+
+    def __init__(self, samples: np.ndarray, loop: bool, generation: int) -> None:
+        self.samples = samples
+        self.pos = 0
+        self.loop = loop
+        self.done = threading.Event()
+        self.generation = generation
 
 
 class AudioEngine:
     """
     Lightweight audio helper that generates tiny WAV clips on the fly and plays
-    them with the system player (afplay/aplay). All sounds are optional.
+    them in-process through sounddevice, or with the system player
+    (afplay/aplay) when sounddevice is unavailable. All sounds are optional.
     """
 
+    # Each clip is a sequence of (freqs, duration, volume) segments; empty freqs is silence.
+    _CLIP_RECIPES: Dict[str, Tuple[Segment, ...]] = {
+        "ambient": (
+            ((110, 220), 0.9, 0.12),
+            ((), 0.08, 0.0),  # tiny pause
+            ((180, 360), 0.7, 0.1),
+            ((140,), 0.6, 0.08),
+        ),
+        "trap": (((90,), 0.12, 0.28), ((60,), 0.09, 0.24)),
+        "medkit": (((480,), 0.1, 0.24), ((640,), 0.1, 0.22)),
+        "helper": (((420, 620), 0.16, 0.2),),
+        "wall": (((80,), 0.08, 0.2), ((60,), 0.06, 0.16)),
+        "drone_hit": (((220,), 0.12, 0.26), ((180,), 0.14, 0.24)),
+        "victory": (
+            ((320,), 0.12, 0.22),
+            ((), 0.02, 0.0),
+            ((520,), 0.14, 0.24),
+            ((720,), 0.15, 0.22),
+        ),
+        "defeat": (((160,), 0.16, 0.24), ((120,), 0.18, 0.22)),
+    }
+    _ALL_KEYS = tuple(_CLIP_RECIPES)
+    # Part of every cached clip's name; bump whenever synthesis changes the
+    # rendered samples so clips from the old renderer are replaced.
+    _RENDER_VERSION = 2
+
+    # One period of sine; tones index into it instead of evaluating sin per sample.
+    _LUT_SIZE = 4096
+    _SIN_LUT = np.sin(np.linspace(0, 2 * np.pi, _LUT_SIZE, endpoint=False))
+
+    _MIX_BLOCK = 512  # frames mixed per stream write
+
     def __init__(self, enabled: bool = True) -> None:
+        # Rendering skips clamping; every preset must stay within full scale.
+        assert all(
+            volume * 0.8 <= 1.0 for recipe in self._CLIP_RECIPES.values() for _, _, volume in recipe
+        ), "clip recipe volume exceeds int16 headroom"
         self.enabled = enabled
         self.player = self._detect_player() if enabled else None
         self.sample_rate = 44100
         self._clips: Dict[str, str] = {}
-        self._procs: List[subprocess.Popen] = []
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._procs: List[PlayerProcess] = []
         self._ambient_thread: Optional[threading.Thread] = None
         self._ambient_stop = threading.Event()
-        self._playing_sfx: Optional[subprocess.Popen] = None  # Track currently playing SFX
+        self._playing_sfx: Optional[PlayerProcess] = None  # Track currently playing SFX
         self.storage_dir: Optional[Path] = None
         try:
             self.storage_dir = Path(__file__).with_name("sounds")
@@ -32,6 +205,67 @@ class AudioEngine:
         except Exception:
             self.storage_dir = None
 
+        # In-process output: a mixer thread sums active voices into one stream,
+        # so playing a clip is a deque append instead of a player subprocess.
+        self._stream = self._open_stream() if enabled else None
+        self._events: Deque[_Voice] = deque(maxlen=64)  # append/popleft are atomic
+        self._mixer_wake = threading.Event()
+        self._generation = 0  # bumped by stop_all to drop every active voice
+        self._ambient_voice: Optional[_Voice] = None
+        if self._stream is not None:
+            threading.Thread(target=self._mixer_loop, daemon=True).start()
+
+        self._clip_lock = threading.Lock()
+        if self.available:
+            # Synthesize any missing clips up front so play() never stalls the UI.
+            threading.Thread(target=self._prewarm, daemon=True).start()
+
+    @property
+    def available(self) -> bool:
+        """True when there is some way to output sound."""
+        return self._stream is not None or self.player is not None
+
+    def _open_stream(self) -> Optional["sd.OutputStream"]:
+        if sd is None:
+            return None
+        try:
+            stream = sd.OutputStream(samplerate=self.sample_rate, channels=1, dtype="int16")
+            stream.start()
+            return stream
+        except Exception:
+            return None
+
+    def _prewarm(self) -> None:
+        self._prune_stale_clips()
+        # With in-process output, also load the sample arrays so even the first
+        # play of each clip is a dict lookup with no file I/O.
+        load = self._clip_samples if self._stream is not None else self._clip
+        for key in self._ALL_KEYS:
+            try:
+                load(key)
+            except Exception:
+                pass
+
+    def _cache_name(self, key: str) -> str:
+        """File name for a cached clip, tagged with a hash of its recipe and renderer."""
+        recipe = repr((self._RENDER_VERSION, self.sample_rate, self._CLIP_RECIPES[key]))
+        digest = hashlib.blake2b(recipe.encode(), digest_size=8).hexdigest()
+        return f"{key}.{digest}.wav"
+
+    def _prune_stale_clips(self) -> None:
+        """Delete cached clips rendered from an older version of their recipe."""
+        if not self.storage_dir:
+            return
+        for key in self._ALL_KEYS:
+            current = self._cache_name(key)
+            # "*wav" also matches the untagged {key}.wav of older releases.
+            for path in self.storage_dir.glob(f"{key}.*wav"):
+                if path.name != current:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
     def _detect_player(self) -> Optional[str]:
         for candidate in ("afplay", "aplay", "paplay"):
             path = shutil.which(candidate)
@@ -41,152 +275,233 @@ class AudioEngine:
 
     def _render_segment(
         self,
+        out: np.ndarray,
         freqs: Iterable[float],
-        duration: float,
         volume: float,
         fade: float = 0.02,
         start_phase: float = 0.0,
-    ) -> Tuple[List[int], float]:
+    ) -> float:
         """
-        Render an audio segment with smooth fading.
-        Returns (samples, end_phase) for continuity between segments.
+        Render an audio segment with smooth fading into the int16 view `out`.
+        Returns end_phase for continuity between segments.
         """
-        frames = int(self.sample_rate * duration)
+        frames = len(out)
         fade_frames = max(1, int(self.sample_rate * fade))
         freqs = list(freqs)
         if not freqs:
             # Silence segment - phase doesn't matter, return as-is
-            return ([0] * frames, start_phase)
+            out[:] = 0
+            return start_phase
 
-        data: List[int] = []
-        for i in range(frames):
-            t = i / self.sample_rate
-            # Generate sample with phase continuity
-            sample = sum(math.sin(2 * math.pi * f * t + start_phase) for f in freqs) / len(freqs)
-
-            # Smooth envelope using sine curve for fade (prevents clicks)
-            envelope = 1.0
-            if i < fade_frames:
-                # Smooth fade-in using sine curve (0 to π/2)
-                fade_ratio = i / fade_frames
-                envelope *= math.sin(fade_ratio * math.pi / 2)
-            elif frames - i < fade_frames:
-                # Smooth fade-out using sine curve (π/2 to 0)
-                fade_ratio = (frames - i) / fade_frames
-                envelope *= math.sin(fade_ratio * math.pi / 2)
-
-            # Apply envelope and volume, with headroom to prevent clipping
-            value = sample * envelope * volume * 0.8  # 0.8 for headroom
-            # Clamp to prevent clipping
-            value = max(-1.0, min(1.0, value))
-            data.append(int(value * 32767))
+        if _render_segment_nb is not None:
+            _render_segment_nb(
+                np.asarray(freqs, dtype=np.float64),
+                frames,
+                fade_frames,
+                volume,
+                start_phase,
+                self.sample_rate,
+                out,
+            )
+        else:
+            self._render_segment_np(out, freqs, fade_frames, volume, start_phase)
 
         # Calculate end phase for continuity
         end_time = frames / self.sample_rate
         end_phase = (2 * math.pi * freqs[0] * end_time + start_phase) % (2 * math.pi)
 
-        return (data, end_phase)
+        return end_phase
+
+    def _render_segment_np(
+        self,
+        out: np.ndarray,
+        freqs: List[float],
+        fade_frames: int,
+        volume: float,
+        start_phase: float,
+    ) -> None:
+        """Vectorized renderer used when numba is not installed."""
+        frames = len(out)
+
+        # Generate all samples at once with phase continuity
+        idx = np.arange(frames)
+        lut_mask = self._LUT_SIZE - 1
+        phase_offset = start_phase * self._LUT_SIZE / (2 * math.pi) + 0.5  # round to nearest entry
+        sample = np.zeros(frames)
+        for f in freqs:
+            lut_idx = (idx * (f * self._LUT_SIZE / self.sample_rate) + phase_offset).astype(np.int64)
+            sample += self._SIN_LUT[lut_idx & lut_mask]
+
+        # Smooth envelope using sine curve for fade (prevents clicks). The
+        # distance to the nearest edge, capped at the fade length, covers
+        # fade-in, sustain and fade-out in one branch-free expression.
+        envelope = np.minimum(np.minimum(idx, frames - idx), fade_frames) * (np.pi / 2 / fade_frames)
+        np.sin(envelope, out=envelope)
 
-    def _write_clip(self, samples: List[int], dest: Optional[Path] = None) -> str:
+        # Apply envelope and volume, with headroom to prevent clipping. Sine mean
+        # and envelope are within [-1, 1], so no clamp is needed before int16.
+        # Work in place on `sample` and cast once into the caller's buffer.
+        sample *= envelope
+        sample *= volume * 0.8 * 32767 / len(freqs)  # mean over freqs, 0.8 for headroom
+        np.rint(sample, out=sample)
+        out[:] = sample
+
+    def _write_clip(self, samples: np.ndarray, dest: Optional[Path] = None) -> str:
+        # The frame count is known up front, so write the header once and
+        # stream the little-endian samples after it; no seek back to patch sizes.
+        frames = np.ascontiguousarray(samples, dtype="<i2")
+        header = _wav_header(len(frames), self.sample_rate)
         if dest:
-            with wave.open(str(dest), "w") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)  # 16-bit PCM
-                wf.setframerate(self.sample_rate)
-                frames = b"".join(struct.pack("<h", s) for s in samples)
-                wf.writeframes(frames)
+            with open(dest, "wb") as f:
+                f.write(header)
+                f.write(frames)
             return str(dest)
 
         with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-            with wave.open(tmp, "w") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)  # 16-bit PCM
-                wf.setframerate(self.sample_rate)
-                frames = b"".join(struct.pack("<h", s) for s in samples)
-                wf.writeframes(frames)
+            tmp.write(header)
+            tmp.write(frames)
             return tmp.name
 
     def _clip(self, key: str) -> Optional[str]:
         if key in self._clips:
             return self._clips[key]
+        with self._clip_lock:
+            return self._build_clip(key)
+
+    def _build_clip(self, key: str) -> Optional[str]:
+        if key in self._clips:
+            return self._clips[key]
+
+        if key not in self._CLIP_RECIPES:
+            return None
+        cache_name = self._cache_name(key)
 
         # Reuse cached file on disk if present.
         if self.storage_dir:
-            cached = self.storage_dir / f"{key}.wav"
+            cached = self.storage_dir / cache_name
             if cached.exists():
                 self._clips[key] = str(cached)
                 return str(cached)
 
-        # Build clips lazily the first time they are used.
+        # Build clips lazily the first time they are used, rendering every
+        # segment straight into one preallocated buffer.
+        recipe = self._CLIP_RECIPES[key]
+        lengths = [int(self.sample_rate * duration) for _, duration, _ in recipe]
+        samples = np.empty(sum(lengths), dtype=np.int16)
         # Use phase continuity to prevent clicks between segments
-        samples: List[int] = []
         phase = 0.0
-
-        if key == "ambient":
-            seg, phase = self._render_segment((110, 220), 0.9, 0.12, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((), 0.08, 0.0, start_phase=phase)  # tiny pause
-            samples.extend(seg)
-            seg, phase = self._render_segment((180, 360), 0.7, 0.1, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((140,), 0.6, 0.08, start_phase=phase)
-            samples.extend(seg)
-        elif key == "trap":
-            seg, phase = self._render_segment((90,), 0.12, 0.28, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((60,), 0.09, 0.24, start_phase=phase)
-            samples.extend(seg)
-        elif key == "medkit":
-            seg, phase = self._render_segment((480,), 0.1, 0.24, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((640,), 0.1, 0.22, start_phase=phase)
-            samples.extend(seg)
-        elif key == "helper":
-            seg, phase = self._render_segment((420, 620), 0.16, 0.2, start_phase=phase)
-            samples.extend(seg)
-        elif key == "wall":
-            seg, phase = self._render_segment((80,), 0.08, 0.2, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((60,), 0.06, 0.16, start_phase=phase)
-            samples.extend(seg)
-        elif key == "drone_hit":
-            seg, phase = self._render_segment((220,), 0.12, 0.26, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((180,), 0.14, 0.24, start_phase=phase)
-            samples.extend(seg)
-        elif key == "victory":
-            seg, phase = self._render_segment((320,), 0.12, 0.22, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((), 0.02, 0.0, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((520,), 0.14, 0.24, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((720,), 0.15, 0.22, start_phase=phase)
-            samples.extend(seg)
-        elif key == "defeat":
-            seg, phase = self._render_segment((160,), 0.16, 0.24, start_phase=phase)
-            samples.extend(seg)
-            seg, phase = self._render_segment((120,), 0.18, 0.22, start_phase=phase)
-            samples.extend(seg)
-        else:
-            return None
+        offset = 0
+        for (freqs, _, volume), length in zip(recipe, lengths):
+            phase = self._render_segment(
+                samples[offset:offset + length], freqs, volume, start_phase=phase
+            )
+            offset += length
 
         dest_path: Optional[Path] = None
         if self.storage_dir:
-            dest_path = self.storage_dir / f"{key}.wav"
+            dest_path = self.storage_dir / cache_name
         path = self._write_clip(samples, dest=dest_path)
+        self._buffers[key] = samples
         self._clips[key] = path
         return path
 
-    def _play_file(self, path: str, block: bool = False, is_sfx: bool = False) -> Optional[subprocess.Popen]:
+    def _clip_samples(self, key: str) -> Optional[np.ndarray]:
+        """Return a clip as int16 samples, mapping the cached WAV once if needed."""
+        samples = self._buffers.get(key)
+        if samples is not None:
+            return samples
+        path = self._clip(key)
+        if not path:
+            return None
+        samples = self._buffers.get(key)
+        if samples is None:
+            samples = self._map_clip(path)
+            self._buffers[key] = samples
+        return samples
+
+    @staticmethod
+    def _map_clip(path: str) -> np.ndarray:
+        """View a WAV's sample data through mmap instead of reading it into memory."""
+        with open(path, "rb") as f:
+            with wave.open(f) as wf:
+                nframes = wf.getnframes()
+                # Header parsing stops at the start of the data chunk.
+                offset = f.tell()
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # The array keeps the mapping alive; it stays valid after the file closes.
+        return np.frombuffer(mapped, dtype="<i2", count=nframes, offset=offset)
+
+    def _mixer_loop(self) -> None:
+        """Mix queued voices block by block and write them to the output stream."""
+        block = self._MIX_BLOCK
+        acc = np.zeros(block, dtype=np.int32)
+        active: List[_Voice] = []
+        while True:
+            while self._events:
+                active.append(self._events.popleft())
+            active = [v for v in active if self._voice_alive(v)]
+            if not active:
+                self._mixer_wake.wait()
+                self._mixer_wake.clear()
+                continue
+
+            acc[:] = 0
+            for voice in active:
+                filled = 0
+                while filled < block:
+                    chunk = voice.samples[voice.pos:voice.pos + block - filled]
+                    acc[filled:filled + len(chunk)] += chunk
+                    filled += len(chunk)
+                    voice.pos += len(chunk)
+                    if voice.pos < len(voice.samples):
+                        continue
+                    if not voice.loop:
+                        break
+                    voice.pos = 0
+            try:
+                self._stream.write(np.clip(acc, -32768, 32767).astype(np.int16))
+            except Exception:
+                pass
+
+    def _voice_alive(self, voice: _Voice) -> bool:
+        if voice.generation == self._generation and (voice.loop or voice.pos < len(voice.samples)):
+            return True
+        voice.done.set()
+        return False
+
+    def _play_samples(self, key: str, block: bool = False, loop: bool = False) -> Optional[_Voice]:
+        samples = self._clip_samples(key)
+        if samples is None or len(samples) == 0:
+            return None
+        voice = _Voice(samples, loop, self._generation)
+        self._events.append(voice)
+        self._mixer_wake.set()
+        if block:
+            voice.done.wait(timeout=len(samples) / self.sample_rate + 1.0)
+        return voice
+
+    def _spawn_player(self, path: str) -> PlayerProcess:
+        """Launch the system player with its output silenced."""
+        args = [self.player, path]
+        if not hasattr(os, "posix_spawn"):
+            return subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # A single posix_spawn call skips Popen's fork/exec bookkeeping.
+        pid = os.posix_spawn(
+            self.player,
+            args,
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_DUP2, 1, 2),
+            ],
+        )
+        return _SpawnedPlayer(pid, args)
+
+    def _play_file(self, path: str, block: bool = False, is_sfx: bool = False) -> Optional[PlayerProcess]:
         if not self.player:
             return None
         try:
-            proc = subprocess.Popen(
-                [self.player, path],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+            proc = self._spawn_player(path)
             if block:
                 proc.wait()
             else:
@@ -200,12 +515,14 @@ class AudioEngine:
                         daemon=True
                     ).start()
                 else:
+                    # Reap finished players so the list stays bounded
+                    self._procs = [p for p in self._procs if p.poll() is None]
                     self._procs.append(proc)
             return proc
         except Exception:
             return None
 
-    def _wait_for_sfx(self, proc: subprocess.Popen) -> None:
+    def _wait_for_sfx(self, proc: PlayerProcess) -> None:
         """Wait for SFX to finish playing, then clear the tracking."""
         try:
             proc.wait()
@@ -217,10 +534,14 @@ class AudioEngine:
 
     def play(self, key: str) -> None:
         """
-        Play a sound effect. If a sound effect is already playing, skip this one.
-        Ambient sounds and victory/defeat are not affected by this check.
+        Play a sound effect. With in-process output, effects overlap freely.
+        With a player subprocess, skip this one if a sound effect is already
+        playing; ambient sounds and victory/defeat are not affected by this check.
         """
-        if not self.enabled or not self.player:
+        if not self.enabled or not self.available:
+            return
+        if self._stream is not None:
+            self._play_samples(key)
             return
 
         # Always allow victory and defeat sounds (they're important)
@@ -245,7 +566,10 @@ class AudioEngine:
         Play a sound effect and wait for it to finish (blocking).
         Used for important sounds like victory/defeat that should not be interrupted.
         """
-        if not self.enabled or not self.player:
+        if not self.enabled or not self.available:
+            return
+        if self._stream is not None:
+            self._play_samples(key, block=True)
             return
         clip = self._clip(key)
         if not clip:
@@ -253,22 +577,36 @@ class AudioEngine:
         self._play_file(clip, block=True, is_sfx=False)
 
     def start_ambient(self) -> None:
-        if not self.enabled or not self.player or (self._ambient_thread and self._ambient_thread.is_alive()):
+        if not self.enabled or not self.available:
+            return
+        if self._stream is not None:
+            if self._ambient_voice is None or self._ambient_voice.done.is_set():
+                self._ambient_voice = self._play_samples("ambient", loop=True)
+            return
+        if self._ambient_thread and self._ambient_thread.is_alive():
             return
         clip = self._clip("ambient")
         if not clip:
             return
 
         self._ambient_stop.clear()
+        # Knowing the clip length lets the loop sleep on the stop event instead of polling.
+        duration = sum(seconds for _, seconds, _ in self._CLIP_RECIPES["ambient"])
 
         def loop() -> None:
             while not self._ambient_stop.is_set():
                 proc = self._play_file(clip, block=False)
                 if not proc:
                     break
-                while proc.poll() is None and not self._ambient_stop.is_set():
-                    time.sleep(0.1)
-                if self._ambient_stop.is_set() and proc.poll() is None:
+                stopped = self._ambient_stop.wait(timeout=duration)
+                while not stopped:
+                    # The player may run slightly past the nominal length.
+                    try:
+                        proc.wait(timeout=0.25)
+                        break
+                    except subprocess.TimeoutExpired:
+                        stopped = self._ambient_stop.is_set()
+                if stopped and proc.poll() is None:
                     try:
                         proc.terminate()
                     except Exception:
@@ -278,6 +616,10 @@ class AudioEngine:
         self._ambient_thread.start()
 
     def stop_ambient(self) -> None:
+        if self._ambient_voice is not None:
+            self._ambient_voice.generation = -1  # the mixer drops stale voices
+            self._mixer_wake.set()
+            self._ambient_voice = None
         if not self._ambient_thread:
             return
         self._ambient_stop.set()
@@ -286,6 +628,9 @@ class AudioEngine:
 
     def stop_all(self) -> None:
         self.stop_ambient()
+        # Silence everything the mixer is playing or has queued
+        self._generation += 1
+        self._mixer_wake.set()
         # Stop currently playing SFX
         if self._playing_sfx and self._playing_sfx.poll() is None:
             try:
@@ -293,20 +638,23 @@ class AudioEngine:
             except Exception:
                 pass
             self._playing_sfx = None
-        # Clean up finished procs
-        alive: List[subprocess.Popen] = []
+        # Terminate anything still running; finished procs are simply dropped
         for proc in self._procs:
             if proc.poll() is None:
                 try:
                     proc.terminate()
                 except Exception:
                     pass
-            else:
-                continue
-            alive.append(proc)
-        self._procs = [p for p in alive if p.poll() is None]
+        self._procs = []
 
     def cleanup(self) -> None:
         self.stop_all()
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
         # Keep cached clips on disk for offline reuse
         self._clips.clear()
+        self._buffers.clear()
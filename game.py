@@ -2,11 +2,14 @@ import random
 import sys
 import re
 import shutil
+import signal
 import tty
 import termios
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Deque, Dict, Iterator, List, Optional, Tuple, Set
 
 from audio import AudioEngine
 from narrator import Narrator, get_persona, list_personas
@@ -14,6 +17,19 @@ from stats import StatsManager
 
 
 Coords = Tuple[int, int]
+DIRS: Tuple[Coords, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_MOVE_DELTAS: Dict[str, Coords] = {"w": (-1, 0), "s": (1, 0), "a": (0, -1), "d": (0, 1)}
+# Final byte of the ESC [ x arrow-key sequences.
+_ARROW_MAP: Dict[str, str] = {
+    "A": "w",  # Up arrow
+    "B": "s",  # Down arrow
+    "C": "d",  # Right arrow
+    "D": "a",  # Left arrow
+}
+
+
+def manhattan(ar: int, ac: int, br: int, bc: int) -> int:
+    return abs(ar - br) + abs(ac - bc)
 
 
 @dataclass(frozen=True)
@@ -66,13 +82,38 @@ DIFFICULTIES: Dict[str, Difficulty] = {
 }
 DIFFICULTY_ORDER = ("easy", "normal", "hard")
 STATS_PATH = Path(__file__).with_name("stats.json")
+_IS_TTY = sys.stdout.isatty()
+_ANSI_STRIP = re.compile(r"\x1b\[[0-9;]*m")
+
+
+# Terminal size is cached and only re-queried on SIGWINCH; _resize_count lets
+# boards notice a resize and fall back to a full redraw.
+_term_size = shutil.get_terminal_size((100, 30))
+_resize_count = 0
+
+
+def _line_rows(line: str, term_width: int) -> int:
+    """Terminal rows a printed line occupies once long lines wrap."""
+    return max(1, -(-len(_ANSI_STRIP.sub("", line)) // term_width))
+
+
+def _on_resize(signum: int, frame: object) -> None:
+    global _term_size, _resize_count
+    _term_size = shutil.get_terminal_size((100, 30))
+    _resize_count += 1
+
+
+def install_resize_handler() -> None:
+    """Refresh the cached terminal size whenever the window is resized."""
+    if hasattr(signal, "SIGWINCH"):
+        signal.signal(signal.SIGWINCH, _on_resize)
 
 
 class Colors:
     """Tiny helper for optional ANSI coloring; falls back if output is not a tty."""
 
     def __init__(self) -> None:
-        self.enabled = sys.stdout.isatty()
+        self.enabled = _IS_TTY
 
     def wrap(self, text: str, code: str) -> str:
         if not self.enabled:
@@ -94,26 +135,28 @@ class Colors:
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
         if self.enabled:
-            print("\033[2J\033[H", end="")
+            sys.stdout.write("\033[2J\033[H")
             sys.stdout.flush()
 
+    def clear_screen_into(self, buf: List[str]) -> None:
+        """Queue a clear-screen sequence onto a frame buffer instead of writing it."""
+        if self.enabled:
+            buf.append("\033[2J\033[H")
+
     def save_cursor(self) -> None:
-        """Save cursor position."""
+        """Save cursor position (picked up by the next flush)."""
         if self.enabled:
-            print("\033[s", end="")
-            sys.stdout.flush()
+            sys.stdout.write("\033[s")
 
     def restore_cursor(self) -> None:
-        """Restore cursor position."""
+        """Restore cursor position (picked up by the next flush)."""
         if self.enabled:
-            print("\033[u", end="")
-            sys.stdout.flush()
+            sys.stdout.write("\033[u")
 
     def move_cursor_home(self) -> None:
-        """Move cursor to top-left."""
+        """Move cursor to top-left (picked up by the next flush)."""
         if self.enabled:
-            print("\033[H", end="")
-            sys.stdout.flush()
+            sys.stdout.write("\033[H")
 
 
 COLORS = Colors()
@@ -123,21 +166,73 @@ class Board:
     def __init__(self, difficulty: Difficulty) -> None:
         self.difficulty = difficulty
         self.size = difficulty.size
+        # In-bounds neighbours of every cell, computed once per board.
+        self._neighbors_of: Dict[Coords, Tuple[Coords, ...]] = {
+            (r, c): tuple(
+                (r + dr, c + dc)
+                for dr, dc in DIRS
+                if 0 <= r + dr < self.size and 0 <= c + dc < self.size
+            )
+            for r in range(self.size)
+            for c in range(self.size)
+        }
+        # Bitmasks for _path_exists: every cell, and all but the edge columns.
+        first_col = sum(1 << (r * self.size) for r in range(self.size))
+        self._board_bits = (1 << (self.size * self.size)) - 1
+        self._not_first_col = self._board_bits & ~first_col
+        self._not_last_col = self._board_bits & ~(first_col << (self.size - 1))
         self.start: Coords = (0, 0)
         self.exit: Coords = (difficulty.size - 1, difficulty.size - 1)
         self.max_health = difficulty.max_health
         self.health = min(difficulty.start_health, difficulty.max_health)
-        self.message_buffer: List[str] = []
+        self.message_buffer: Deque[str] = deque(maxlen=5)
         self.turns_taken = 0
 
         self.walls: Set[Coords] = set()
         self.traps: Set[Coords] = set()
         self.medkits: Set[Coords] = set()
         self.drones: List[Coords] = []
+        self.drone_cells: Set[Coords] = set()  # Mirrors drones for O(1) lookups.
         self.helper: Optional[Coords] = None
         self.drone_jam_turns = 0
         self.player: Coords = self.start
 
+        # Colored glyphs and fixed text never change during a run; wrap them once per board.
+        self._glyph_player = COLORS.green("P")
+        self._glyph_exit = COLORS.yellow("E")
+        self._glyph_medkit = COLORS.green("+")
+        self._glyph_trap = COLORS.red("^")
+        self._glyph_drone = COLORS.red("D")
+        self._glyph_helper = COLORS.cyan("H")
+        self._legend_line = COLORS.cyan(
+            "[P] you  [E] exit  [#] wall  [^] trap (-1 hp)  [+] medkit (+1 hp)  "
+            "[D] drone  [H] helper  •  Controls: WASD or Arrow Keys, Q to quit"
+        )
+        self._events_header = COLORS.cyan("=== Recent Events ===")
+        # Static features (walls, traps, medkits, exit, helper) as one glyph per
+        # cell; draw() only overlays the player and drones on a copy.
+        self._glyph_grid: List[List[str]] = []
+        # Incremental redraw state: cells, status and messages touched since the
+        # last frame, plus the layout that frame was drawn with.
+        self._dirty: Set[Coords] = set()
+        self._messages_dirty = False
+        self._needs_full_draw = True
+        self._drawn_status = ""
+        self._drawn_term_width = 0
+        self._drawn_resize_count = -1
+        self._drawn_grid_pad = 0
+        # Screen rows (1-based) of the status line, grid row 0 and the footer,
+        # counting header lines that wrap on narrow terminals.
+        self._drawn_status_row = 2
+        self._drawn_status_rows = 1
+        self._drawn_grid_row = 4
+        self._drawn_footer_row = 0
+        self._drawn_footer_rows = 0
+        # Grid glyphs are one visible character each, so the block width is fixed.
+        self._grid_header = "    " + " ".join(str(c) for c in range(self.size))
+        self._grid_visible_width = max(len(self._grid_header), 4 + 2 * self.size)
+        self._grid_pad = ""
+
         self._populate()
 
     def _populate(self) -> None:
@@ -147,15 +242,33 @@ class Board:
             self._reset_contents()
             self._place_features()
             if self._path_exists():
+                self._build_glyph_grid()
                 break
             if attempts > 40:
                 raise RuntimeError("Unable to create a solvable board after many attempts.")
 
+    def _build_glyph_grid(self) -> None:
+        grid = [["."] * self.size for _ in range(self.size)]
+        if self.helper:
+            grid[self.helper[0]][self.helper[1]] = self._glyph_helper
+        for r, c in self.traps:
+            grid[r][c] = self._glyph_trap
+        for r, c in self.medkits:
+            grid[r][c] = self._glyph_medkit
+        for r, c in self.walls:
+            grid[r][c] = "#"
+        grid[self.exit[0]][self.exit[1]] = self._glyph_exit
+        self._glyph_grid = grid
+
+    def _clear_glyph(self, coord: Coords) -> None:
+        self._glyph_grid[coord[0]][coord[1]] = "."
+
     def _reset_contents(self) -> None:
         self.walls.clear()
         self.traps.clear()
         self.medkits.clear()
         self.drones.clear()
+        self.drone_cells.clear()
         self.helper = None
         self.player = self.start
         self.turns_taken = 0
@@ -163,94 +276,103 @@ class Board:
         self.health = min(self.difficulty.start_health, self.max_health)
 
     def _place_features(self) -> None:
-        open_cells = set((r, c) for r in range(self.size) for c in range(self.size))
-        blocked = {self.start, self.exit}
-
-        def take_random(count: int, extra_avoid: Optional[Set[Coords]] = None) -> Set[Coords]:
-            picks: Set[Coords] = set()
-            avoid: Set[Coords] = set(extra_avoid or set())
-            for _ in range(count):
-                candidates = open_cells - blocked - avoid
-                if not candidates:
-                    raise RuntimeError("Not enough open cells to place all features.")
-                choice = random.choice(list(candidates))
-                picks.add(choice)
-                blocked.add(choice)
-                avoid.add(choice)
-            return picks
+        # Cells still free for placement. A pick swaps the chosen cell to the
+        # end and pops it, so each pick is O(1) instead of a set difference.
+        free_list: List[Coords] = [
+            (r, c)
+            for r in range(self.size)
+            for c in range(self.size)
+            if (r, c) != self.start and (r, c) != self.exit
+        ]
 
         wall_count = self.difficulty.wall_count
         trap_count = self.difficulty.trap_count
         medkit_count = self.difficulty.medkit_count
         drone_count = self.difficulty.drone_count
 
-        self.walls = take_random(wall_count)
-        self.traps = take_random(trap_count)
+        self.walls = self._take_random(free_list, wall_count)
+        self.traps = self._take_random(free_list, trap_count)
         medkit_avoid = set(self._neighbors(self.start)) | set(self._neighbors(self.exit))
-        self.medkits = take_random(medkit_count, extra_avoid=medkit_avoid)
+        self.medkits = self._take_random(free_list, medkit_count, avoid=medkit_avoid)
 
-        self.helper = random.choice(list(open_cells - blocked))
-        blocked.add(self.helper)
+        self.helper = self._pop_random(free_list)
 
         for _ in range(drone_count):
-            choice = random.choice(list(open_cells - blocked))
-            self.drones.append(choice)
-            blocked.add(choice)
+            self.drones.append(self._pop_random(free_list))
+        self.drone_cells = set(self.drones)
+
+    @staticmethod
+    def _pop_random(free_list: List[Coords]) -> Coords:
+        """Remove and return a random cell from free_list in O(1) (swap-and-pop)."""
+        if not free_list:
+            raise RuntimeError("Not enough open cells to place all features.")
+        i = random.randrange(len(free_list))
+        free_list[i], free_list[-1] = free_list[-1], free_list[i]
+        return free_list.pop()
+
+    def _take_random(
+        self,
+        free_list: List[Coords],
+        count: int,
+        avoid: Optional[Set[Coords]] = None,
+    ) -> Set[Coords]:
+        if not avoid:
+            return {self._pop_random(free_list) for _ in range(count)}
+        # Set avoided cells aside for these picks, then return them to the pool.
+        held = [cell for cell in free_list if cell in avoid]
+        free_list[:] = [cell for cell in free_list if cell not in avoid]
+        try:
+            return {self._pop_random(free_list) for _ in range(count)}
+        finally:
+            free_list.extend(held)
 
     def _path_exists(self) -> bool:
-        """Ensure there's a path from start to exit ignoring traps/drones."""
-        queue = [self.start]
-        visited = {self.start}
-        while queue:
-            r, c = queue.pop(0)
-            if (r, c) == self.exit:
+        """Ensure there's a path from start to exit ignoring traps/drones.
+
+        Flood-fills whole BFS layers at once on integer bitmasks (bit
+        ``r * size + c`` per cell) instead of hashing coordinate tuples.
+        """
+        size = self.size
+        walls_bits = 0
+        for r, c in self.walls:
+            walls_bits |= 1 << (r * size + c)
+        open_bits = self._board_bits & ~walls_bits
+        goal = 1 << (self.exit[0] * size + self.exit[1])
+        frontier = visited = 1 << (self.start[0] * size + self.start[1])
+        if frontier & goal:
+            return True
+        while frontier:
+            # Column masks drop bits that wrapped onto the neighbouring row.
+            spread = (
+                ((frontier << 1) & self._not_first_col)
+                | ((frontier >> 1) & self._not_last_col)
+                | (frontier << size)
+                | (frontier >> size)
+            )
+            frontier = spread & open_bits & ~visited
+            if frontier & goal:
                 return True
-            for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nr, nc = r + dr, c + dc
-                nxt = (nr, nc)
-                if (
-                    0 <= nr < self.size
-                    and 0 <= nc < self.size
-                    and nxt not in self.walls
-                    and nxt not in visited
-                ):
-                    visited.add(nxt)
-                    queue.append(nxt)
+            visited |= frontier
         return False
 
     def add_message(self, message: str) -> None:
         """Add a message to the message buffer (max 5 messages)."""
         if message:
-            self.message_buffer.append(message)
-            # Keep only last 5 messages
-            if len(self.message_buffer) > 5:
-                self.message_buffer = self.message_buffer[-5:]
+            self.message_buffer.append(message)  # deque drops the oldest past 5
+            self._messages_dirty = True
 
-    def draw(self) -> None:
-        # Always clear screen and move to home position for consistent display
-        COLORS.clear_screen()
-        legend = (
-            "[P] you  [E] exit  [#] wall  [^] trap (-1 hp)  [+] medkit (+1 hp)  "
-            "[D] drone  [H] helper  •  Controls: WASD or Arrow Keys, Q to quit"
-        )
-        header_lines = [
-            COLORS.cyan(legend),
+    def _status_line(self) -> str:
+        return (
             f"Difficulty: {self.difficulty.name}   "
             f"Health: {self.health}/{self.max_health}   "
-            f"Turn: {self.turns_taken}",
-        ]
-        grid_lines = ["    " + " ".join(str(c) for c in range(self.size))]
-        for r in range(self.size):
-            row = []
-            for c in range(self.size):
-                cell = self._cell_repr((r, c))
-                row.append(cell)
-            grid_lines.append(f"{r:>2} | " + " ".join(row))
+            f"Turn: {self.turns_taken}"
+        )
 
-        footer_lines = [COLORS.cyan("=== Recent Events ===")]
+    def _footer_lines(self) -> List[str]:
+        footer_lines = [self._events_header]
         # Always show exactly 5 lines in footer for consistent positioning
         if self.message_buffer:
-            recent_messages = self.message_buffer[-5:]
+            recent_messages = list(self.message_buffer)
             # Pad to exactly 5 lines if needed
             while len(recent_messages) < 5:
                 recent_messages.append("")
@@ -259,48 +381,116 @@ class Board:
             # Show 5 empty lines to maintain consistent footer height
             footer_lines.extend(["(No recent events)"] + [""] * 4)
         footer_lines.append("")  # Final blank line
+        return footer_lines
 
-        # Center only the grid block horizontally.
-        term_width, _ = shutil.get_terminal_size((100, 30))
-        ansi_strip = re.compile(r"\x1b\[[0-9;]*m")
+    def _cell_glyph(self, coord: Coords) -> str:
+        if coord == self.player:
+            return self._glyph_player
+        glyph = self._glyph_grid[coord[0]][coord[1]]
+        if (glyph == "." or glyph == self._glyph_helper) and coord in self.drone_cells:
+            return self._glyph_drone
+        return glyph
 
-        def visible_len(text: str) -> int:
-            return len(ansi_strip.sub("", text))
+    def draw(self) -> None:
+        # Build the whole frame, clear included, and emit it with one write.
+        buf: List[str] = []
+        COLORS.clear_screen_into(buf)
+        status = self._status_line()
+        header_lines = [self._legend_line, status]
+        grid = [row[:] for row in self._glyph_grid]
+        # Drones show only on empty or helper cells, like the original precedence.
+        for r, c in self.drones:
+            if grid[r][c] == "." or grid[r][c] == self._glyph_helper:
+                grid[r][c] = self._glyph_drone
+        grid[self.player[0]][self.player[1]] = self._glyph_player
+        grid_lines = [self._grid_header]
+        for r, row in enumerate(grid):
+            grid_lines.append(f"{r:>2} | " + " ".join(row))
 
-        grid_max = max(visible_len(line) for line in grid_lines) if grid_lines else 0
-        grid_pad = " " * max(0, (term_width - grid_max) // 2)
+        footer_lines = self._footer_lines()
+
+        # Center only the grid block horizontally.
+        term_width = _term_size.columns
+        if term_width != self._drawn_term_width:
+            self._grid_pad = " " * max(0, (term_width - self._grid_visible_width) // 2)
+        grid_pad = self._grid_pad
 
         for line in header_lines:
-            print(line)
+            buf.append(line + "\n")
         for line in grid_lines:
-            print(f"{grid_pad}{line}")
+            buf.append(f"{grid_pad}{line}\n")
         for line in footer_lines:
-            print(line)
+            buf.append(line + "\n")
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+
+        self._dirty.clear()
+        self._messages_dirty = False
+        self._drawn_status = status
+        self._drawn_term_width = term_width
+        self._drawn_resize_count = _resize_count
+        self._drawn_grid_pad = len(grid_pad)
+        legend_rows = _line_rows(self._legend_line, term_width)
+        self._drawn_status_row = legend_rows + 1
+        self._drawn_status_rows = _line_rows(status, term_width)
+        self._drawn_grid_row = self._drawn_status_row + self._drawn_status_rows + 1
+        self._drawn_footer_row = self._drawn_grid_row + self.size
+        self._drawn_footer_rows = sum(_line_rows(line, term_width) for line in footer_lines)
+        # Cursor addressing needs unwrapped grid rows and a frame that didn't scroll.
+        self._needs_full_draw = (
+            not COLORS.enabled
+            or len(grid_pad) + self._grid_visible_width > term_width
+            or self._drawn_footer_row + self._drawn_footer_rows > _term_size.lines
+        )
 
-    def _cell_repr(self, coord: Coords) -> str:
-        if coord == self.player:
-            return COLORS.green("P")
-        if coord == self.exit:
-            return COLORS.yellow("E")
-        if coord in self.walls:
-            return "#"
-        if coord in self.medkits:
-            return COLORS.green("+")
-        if coord in self.traps:
-            return COLORS.red("^")
-        if coord in self.drones:
-            return COLORS.red("D")
-        if self.helper and coord == self.helper:
-            return COLORS.cyan("H")
-        return "."
+    def draw_incremental(self) -> None:
+        """Redraw only what changed since the last frame, falling back to draw()."""
+        if self._needs_full_draw:
+            self.draw()
+            return
+        if self._drawn_resize_count != _resize_count:
+            self.draw()
+            return
+        term_width = self._drawn_term_width
+        status = self._status_line()
+        status_changed = status != self._drawn_status
+        if status_changed and max(self._drawn_status_rows, _line_rows(status, term_width)) > 1:
+            self.draw()
+            return
+        footer_row = self._drawn_footer_row
+        footer_lines: List[str] = []
+        footer_rows = self._drawn_footer_rows
+        if self._messages_dirty:
+            footer_lines = self._footer_lines()
+            footer_rows = sum(_line_rows(line, term_width) for line in footer_lines)
+            if footer_row + footer_rows > _term_size.lines:
+                self.draw()
+                return
+
+        buf: List[str] = []
+        if status_changed:
+            buf.append(f"\033[{self._drawn_status_row};1H\033[K{status}")
+            self._drawn_status = status
+        grid_row = self._drawn_grid_row
+        col_base = self._drawn_grid_pad + 6
+        for r, c in self._dirty:
+            buf.append(f"\033[{grid_row + r};{col_base + 2 * c}H{self._cell_glyph((r, c))}")
+        if footer_lines:
+            # Rewrite the footer as the full draw does, letting long lines wrap;
+            # this also leaves the cursor below it with the old prompt wiped.
+            buf.append(f"\033[{footer_row};1H\033[J")
+            buf.extend(line + "\n" for line in footer_lines)
+            self._drawn_footer_rows = footer_rows
+        else:
+            # Park the cursor below the footer and wipe the previous prompt line.
+            buf.append(f"\033[{footer_row + footer_rows};1H\033[J")
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+        self._dirty.clear()
+        self._messages_dirty = False
 
     def handle_player_move(self, direction: str) -> Tuple[str, Optional[str]]:
-        dr, dc = {
-            "w": (-1, 0),
-            "s": (1, 0),
-            "a": (0, -1),
-            "d": (0, 1),
-        }.get(direction, (0, 0))
+        dr, dc = _MOVE_DELTAS.get(direction, (0, 0))
 
         nr = self.player[0] + dr
         nc = self.player[1] + dc
@@ -309,18 +499,23 @@ class Board:
         if (nr, nc) in self.walls:
             return "That way is sealed by a wall.", "wall"
 
+        self._dirty.add(self.player)
         self.player = (nr, nc)
+        self._dirty.add(self.player)
         notice_parts: List[str] = []
         move_event: Optional[str] = None
         if self.player in self.traps:
             self.health -= 1
             self.traps.remove(self.player)
+            self._clear_glyph(self.player)
             notice_parts.append("A hidden spike nicks you. (-1 hp)")
         if self.player in self.medkits:
             self.health = min(self.max_health, self.health + 1)
             self.medkits.remove(self.player)
+            self._clear_glyph(self.player)
             notice_parts.append("You patch yourself up. (+1 hp)")
         if self.helper and self.player == self.helper:
+            self._clear_glyph(self.player)
             self.helper = None
             self.drone_jam_turns = 2
             healed = False
@@ -343,76 +538,77 @@ class Board:
             return "Drones buzz in place under the signal jam."
         new_positions: List[Coords] = []
         notice_parts: List[str] = []
+        pr, pc = self.player
         for idx, drone in enumerate(self.drones):
             options = self._neighbors(drone)
             options = [pos for pos in options if pos not in self.walls]
             if not options:
                 new_positions.append(drone)
                 continue
-            # Drift randomly, bias 25% toward the player.
+            # Drift randomly; 25% of the time step toward the player instead.
             if random.random() < 0.25:
-                options.sort(key=lambda p: self._manhattan(p, self.player))
-            next_pos = random.choice(options)
+                next_pos = min(options, key=lambda p: abs(p[0] - pr) + abs(p[1] - pc))
+            else:
+                next_pos = random.choice(options)
             if next_pos == self.player:
                 new_positions.append(next_pos)
                 notice_parts.append(f"Drone {idx + 1} crashes into you!")
             else:
                 new_positions.append(next_pos)
+        self._dirty.update(self.drones)
+        self._dirty.update(new_positions)
         self.drones = new_positions
+        self.drone_cells = set(new_positions)
         return " ".join(notice_parts)
 
-    def _neighbors(self, coord: Coords) -> List[Coords]:
-        r, c = coord
-        moves = []
-        for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < self.size and 0 <= nc < self.size:
-                moves.append((nr, nc))
-        return moves
-
-    def _manhattan(self, a: Coords, b: Coords) -> int:
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+    def _neighbors(self, coord: Coords) -> Tuple[Coords, ...]:
+        return self._neighbors_of[coord]
 
     def nearest_drone_distance(self) -> Optional[int]:
         if not self.drones:
             return None
-        return min(self._manhattan(self.player, drone) for drone in self.drones)
-
+        pr, pc = self.player
+        return min(manhattan(pr, pc, dr, dc) for dr, dc in self.drones)
 
-def prompt() -> str:
-    """Read a single keypress without requiring Enter. Supports arrow keys."""
-    if not sys.stdout.isatty():
-        # Fallback to regular input if not a TTY
-        raw = input("Move (w/a/s/d/arrows) or 'q' to quit: ").strip().lower()
-        return raw
 
-    # Save terminal settings
+@contextmanager
+def raw_mode() -> Iterator[None]:
+    """Keep stdin unbuffered and unechoed for a whole round; no-op off a tty."""
+    if not _IS_TTY:
+        yield
+        return
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
     try:
-        # Set terminal to raw mode to read single character
-        tty.setraw(fd)
-        ch = sys.stdin.read(1)
-
-        # Handle arrow keys (escape sequences)
-        if ch == '\x1b':  # ESC
-            ch2 = sys.stdin.read(1)
-            if ch2 == '[':
-                ch3 = sys.stdin.read(1)
-                arrow_map = {
-                    'A': 'w',  # Up arrow
-                    'B': 's',  # Down arrow
-                    'C': 'd',  # Right arrow
-                    'D': 'a',  # Left arrow
-                }
-                return arrow_map.get(ch3, '')
-
-        return ch.lower()
+        # cbreak rather than raw so output keeps its newline translation.
+        tty.setcbreak(fd)
+        yield
     finally:
-        # Restore terminal settings
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
+def prompt() -> str:
+    """Read a single keypress without requiring Enter. Supports arrow keys.
+
+    Expects to run inside raw_mode() when attached to a terminal.
+    """
+    if not _IS_TTY:
+        # Fallback to regular input if not a TTY
+        raw = input("Move (w/a/s/d/arrows) or 'q' to quit: ").strip().lower()
+        return raw
+
+    ch = sys.stdin.read(1)
+
+    # Handle arrow keys (escape sequences)
+    if ch == '\x1b':  # ESC
+        ch2 = sys.stdin.read(1)
+        if ch2 == '[':
+            ch3 = sys.stdin.read(1)
+            return _ARROW_MAP.get(ch3, '')
+
+    return ch.lower()
+
+
 def choose_difficulty() -> Tuple[str, Difficulty]:
     print(COLORS.cyan("Choose difficulty:"))
     for key in DIFFICULTY_ORDER:
@@ -489,7 +685,11 @@ def play_round(
 ) -> None:
     board = Board(difficulty)
     narrator.reset_round_state()  # Reset all narrator state for new round
-    start_line = narrator.describe("start", board.health, board.max_health)
+    # Bound once per round; the loop narrates several events every turn.
+    describe = narrator.describe
+    ambient_status = narrator.ambient_status
+    narrating = narrator.enabled
+    start_line = describe("start", board.health, board.max_health)
     if start_line:
         board.add_message(COLORS.yellow(start_line))
 
@@ -498,111 +698,113 @@ def play_round(
     audio.start_ambient()
 
     result = "quit"
-    while True:
-        board.draw()
-        if board.player == board.exit:
-            board.add_message(COLORS.green("You jack the vault core and slip away. Victory!"))
-            victory_line = narrator.describe("victory", board.health, board.max_health)
-            if victory_line:
-                board.add_message(COLORS.yellow(victory_line))
-            audio.play_blocking("victory")  # Play victory sound and wait for it to finish
-            result = "victory"
-            break
-        if board.health <= 0:
-            board.add_message(COLORS.red("You collapse before reaching the exit. Game over."))
-            defeat_line = narrator.describe("defeat", board.health, board.max_health)
-            if defeat_line:
-                board.add_message(COLORS.yellow(defeat_line))
-            audio.play_blocking("defeat")  # Play defeat sound and wait for it to finish
-            result = "defeat"
-            break
+    with raw_mode():
+        while True:
+            board.draw_incremental()
+            if board.player == board.exit:
+                board.add_message(COLORS.green("You jack the vault core and slip away. Victory!"))
+                victory_line = describe("victory", board.health, board.max_health)
+                if victory_line:
+                    board.add_message(COLORS.yellow(victory_line))
+                audio.play_blocking("victory")  # Play victory sound and wait for it to finish
+                result = "victory"
+                break
+            if board.health <= 0:
+                board.add_message(COLORS.red("You collapse before reaching the exit. Game over."))
+                defeat_line = describe("defeat", board.health, board.max_health)
+                if defeat_line:
+                    board.add_message(COLORS.yellow(defeat_line))
+                audio.play_blocking("defeat")  # Play defeat sound and wait for it to finish
+                result = "defeat"
+                break
 
-        choice = prompt()
-        if choice == "q":
-            narrator.stop_tts()  # Stop TTS immediately before describing quit
-            board.add_message("You abandon the run.")
-            quit_line = narrator.describe("quit", board.health, board.max_health)
-            if quit_line:
-                board.add_message(COLORS.yellow(quit_line))
-            result = "quit"
-            break
-        if choice not in {"w", "a", "s", "d"}:
-            board.add_message("Invalid input. Use w/a/s/d or q.")
-            continue
+            choice = prompt()
+            if choice == "q":
+                narrator.stop_tts()  # Stop TTS immediately before describing quit
+                board.add_message("You abandon the run.")
+                quit_line = describe("quit", board.health, board.max_health)
+                if quit_line:
+                    board.add_message(COLORS.yellow(quit_line))
+                result = "quit"
+                break
+            if choice not in {"w", "a", "s", "d"}:
+                board.add_message("Invalid input. Use w/a/s/d or q.")
+                continue
+
+            prev_health = board.health
+            notice, move_event = board.handle_player_move(choice)
+            if move_event == "wall":
+                if notice:
+                    board.add_message(notice)
+                wall_line = describe("wall", board.health, board.max_health)
+                if wall_line:
+                    board.add_message(COLORS.yellow(wall_line))
+                audio.play("wall")
+                continue
 
-        prev_health = board.health
-        notice, move_event = board.handle_player_move(choice)
-        if move_event == "wall":
+            board.turns_taken += 1
+            drone_notice = board.move_drones()
             if notice:
                 board.add_message(notice)
-            wall_line = narrator.describe("wall", board.health, board.max_health)
-            if wall_line:
-                board.add_message(COLORS.yellow(wall_line))
-            audio.play("wall")
-            continue
-
-        board.turns_taken += 1
-        drone_notice = board.move_drones()
-        if notice:
-            board.add_message(notice)
-            if move_event == "helper":
-                helper_line = narrator.describe("helper", board.health, board.max_health)
-                if helper_line:
-                    board.add_message(COLORS.yellow(helper_line))
-                audio.play("helper")
-        if board.health < prev_health:
-            trap_line = narrator.describe("trap", board.health, board.max_health)
-            if trap_line:
-                board.add_message(COLORS.yellow(trap_line))
-            audio.play("trap")
-        elif board.health > prev_health:
-            medkit_line = narrator.describe("medkit", board.health, board.max_health)
-            if medkit_line:
-                board.add_message(COLORS.yellow(medkit_line))
-            audio.play("medkit")
-        if (
-            board.health > 0
-            and board.health <= max(1, board.max_health // 2)
-            and not narrator.low_health_noted()
-        ):
-            low_line = narrator.describe("low_health", board.health, board.max_health)
-            if low_line:
-                narrator.mark_low_health()
-                board.add_message(COLORS.yellow(low_line))
-        if drone_notice:
-            board.add_message(drone_notice)
-        if any(drone == board.player for drone in board.drones):
-            board.health = 0
-            board.add_message(COLORS.red("A drone slams into you!"))
-            drone_line = narrator.describe("drone_hit", board.health, board.max_health)
-            if drone_line:
-                board.add_message(COLORS.yellow(drone_line))
-            audio.play("drone_hit")
-        nearest = board.nearest_drone_distance()
-        if (
-            nearest is not None
-            and nearest <= 1
-            and board.health > 0
-            and board.player != board.exit
-        ):
-            near_line = narrator.describe(
-                "near_miss", board.health, board.max_health, proximity=nearest
-            )
-            if near_line:
-                board.add_message(COLORS.yellow(near_line))
-        if board.health > 0 and board.player != board.exit:
-            status_line = narrator.ambient_status(
-                board.health, board.max_health, nearest, board.turns_taken
-            )
-            if status_line:
-                board.add_message(COLORS.yellow(status_line))
+                if move_event == "helper":
+                    helper_line = describe("helper", board.health, board.max_health)
+                    if helper_line:
+                        board.add_message(COLORS.yellow(helper_line))
+                    audio.play("helper")
+            if board.health < prev_health:
+                trap_line = describe("trap", board.health, board.max_health)
+                if trap_line:
+                    board.add_message(COLORS.yellow(trap_line))
+                audio.play("trap")
+            elif board.health > prev_health:
+                medkit_line = describe("medkit", board.health, board.max_health)
+                if medkit_line:
+                    board.add_message(COLORS.yellow(medkit_line))
+                audio.play("medkit")
+            if (
+                board.health > 0
+                and board.health <= max(1, board.max_health // 2)
+                and not narrator.low_health_noted()
+            ):
+                low_line = describe("low_health", board.health, board.max_health)
+                if low_line:
+                    narrator.mark_low_health()
+                    board.add_message(COLORS.yellow(low_line))
+            if drone_notice:
+                board.add_message(drone_notice)
+            if board.player in board.drone_cells:
+                board.health = 0
+                board.add_message(COLORS.red("A drone slams into you!"))
+                drone_line = describe("drone_hit", board.health, board.max_health)
+                if drone_line:
+                    board.add_message(COLORS.yellow(drone_line))
+                audio.play("drone_hit")
+            nearest = board.nearest_drone_distance()
+            if (
+                narrating
+                and nearest is not None
+                and nearest <= 1
+                and board.health > 0
+                and board.player != board.exit
+            ):
+                near_line = describe(
+                    "near_miss", board.health, board.max_health, proximity=nearest
+                )
+                if near_line:
+                    board.add_message(COLORS.yellow(near_line))
+            if narrating and board.health > 0 and board.player != board.exit:
+                status_line = ambient_status(
+                    board.health, board.max_health, nearest, board.turns_taken
+                )
+                if status_line:
+                    board.add_message(COLORS.yellow(status_line))
 
     audio.stop_all()
     stats_result = stats.record_run(diff_key, board.turns_taken, result)
     stats_line = stats.summary_line(diff_key)
     print(COLORS.cyan(f"Stats [{difficulty.name}]: {stats_line}"))
     if result == "victory" and stats_result.new_best:
-        best_line = narrator.describe(
+        best_line = describe(
             "record",
             board.health,
             board.max_health,
@@ -611,7 +813,7 @@ def play_round(
         if best_line:
             print(COLORS.yellow(best_line))
     if result == "victory" and stats_result.streak >= 3:
-        streak_line = narrator.describe(
+        streak_line = describe(
             "streak",
             board.health,
             board.max_health,
@@ -628,10 +830,11 @@ def main() -> None:
     )
     print("Controls: w/a/s/d to move, q to quit. Walls block movement.")
 
+    install_resize_handler()
     stats = StatsManager(STATS_PATH, DIFFICULTY_ORDER)
     audio = AudioEngine(enabled=True)
-    if not audio.player:
-        print(COLORS.yellow("No system audio player found (afplay/aplay). Continuing muted."))
+    if not audio.available:
+        print(COLORS.yellow("No audio output found (sounddevice/afplay/aplay). Continuing muted."))
         audio.enabled = False
 
     diff_key: Optional[str] = None
@@ -656,6 +859,7 @@ def main() -> None:
                 break
     finally:
         audio.cleanup()
+        stats.shutdown()
 
 
 if __name__ == "__main__":
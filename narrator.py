@@ -1,22 +1,73 @@
 import os
 import random
+import shutil
+import socket
+import string
 import subprocess
 import tempfile
 import threading
+import time
 import queue
 import asyncio
+import atexit
+import bisect
+import functools
+import hashlib
+import json
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Optional, Tuple
 from pathlib import Path
 
-# Load environment variables from .env file if it exists
-try:
-    from dotenv import load_dotenv
+
+@functools.lru_cache(maxsize=1)
+def _ensure_env_loaded() -> None:
+    """Load environment variables from the .env file, at most once per process."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return  # dotenv not installed, use system environment variables
     env_path = Path(__file__).parent / '.env'
     if env_path.exists():
         load_dotenv(env_path)
-except ImportError:
-    pass  # dotenv not installed, use system environment variables
+
+
+@functools.lru_cache(maxsize=1)
+def _edge_tts_module() -> Optional[Any]:
+    """Import edge_tts once; None if it is not installed."""
+    try:
+        import edge_tts
+    except ImportError:
+        return None
+    return edge_tts
+
+
+@functools.lru_cache(maxsize=1)
+def _openai_module() -> Optional[Any]:
+    """Import openai once; None if it is missing or fails to import."""
+    try:
+        import openai
+    except Exception:
+        return None
+    return openai
+
+
+@dataclass(frozen=True)
+class _EnvSettings:
+    openai_key: Optional[str]
+    tts_model: str
+    chat_model: str
+
+
+@functools.lru_cache(maxsize=1)
+def _env_settings() -> _EnvSettings:
+    """Snapshot the narration settings from the environment (after .env) once."""
+    _ensure_env_loaded()
+    return _EnvSettings(
+        openai_key=os.environ.get("OPENAI_API_KEY"),
+        tts_model=os.environ.get("TTS_MODEL", "gpt-4o-mini-tts"),
+        chat_model=os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
+    )
 
 
 @dataclass(frozen=True)
@@ -26,6 +77,11 @@ class Persona:
     style: str
     events: Dict[str, List[str]]
     tension_lines: Dict[str, List[str]]
+    voice: str  # OpenAI TTS voice
+    edge_voice: str  # Microsoft Edge TTS voice
+    instructions: str  # OpenAI TTS delivery instructions
+    # Events whose lines stand alone, without a tension line appended.
+    events_without_tension: FrozenSet[str] = frozenset({"victory", "defeat", "quit"})
 
 
 PERSONAS: Dict[str, Persona] = {
@@ -106,6 +162,19 @@ PERSONAS: Dict[str, Persona] = {
                 "Red warning halos your vision. Move or be swallowed.",
             ],
         },
+        voice="onyx",  # Deep, dramatic, cinematic - perfect for heist-show host
+        edge_voice="en-US-GuyNeural",  # Deep, expressive male voice
+        instructions="""Voice Affect: Cinematic, breathless, and theatrical; carries the intensity of a live broadcast commentator.
+
+Tone: Dramatic heist-show host; speaks with breathless excitement and cinematic gravitas—like narrating a high-stakes heist in real-time.
+
+Pacing: Varied and dramatic; breathless during action, slower and more deliberate during tension—let the drama guide tempo. Quicken pace during near-misses and victories.
+
+Emotion: Intensely expressive; let emotions range from quiet intensity to dramatic peaks. Convey urgency, tension, and triumph with full theatricality.
+
+Pronunciation: Powerful and resonant; emphasize dramatic words ("vault", "drone", "shadow", "blackout") and let the voice's depth add cinematic weight.
+
+Pauses: Cinematic pauses; use silence dramatically—brief pauses for tension ("fate leans closer"), longer pauses for impact ("final blackout"). Let dramatic moments land with weight.""",
     ),
     "mentor": Persona(
         key="mentor",
@@ -183,6 +252,19 @@ PERSONAS: Dict[str, Persona] = {
                 "Everything's loud; make tight, deliberate moves.",
             ],
         },
+        voice="coral",  # Calm, composed, reassuring - ideal for steady coach
+        edge_voice="en-US-AriaNeural",  # Calm, clear female voice
+        instructions="""Voice Affect: Calm, steady, and composed; projects quiet authority and unwavering confidence.
+
+Tone: Steady, encouraging coach in your earpiece; speaks with measured calm and tactical precision—like a trusted mission control operator.
+
+Pacing: Steady and measured; deliberate enough to ensure clarity and maintain composure, efficient enough to provide timely guidance. Never rushed, even under pressure.
+
+Emotion: Calm and measured; convey concern or encouragement through subtle tone shifts rather than obvious emotion. Maintain steady composure even during tense moments.
+
+Pronunciation: Clear and precise; emphasize tactical information ("vitals", "tiles", "drone") and key instructions. Speak with quiet authority.
+
+Pauses: Brief, thoughtful pauses; pause after delivering status updates or instructions, allowing information to land. Use pauses to emphasize key tactical points.""",
     ),
     "humorous": Persona(
         key="humorous",
@@ -261,6 +343,19 @@ PERSONAS: Dict[str, Persona] = {
                 "Panic? Never heard of it. Also, you're almost toast.",
             ],
         },
+        voice="echo",  # Bold, energetic, dynamic - great for sarcastic sidekick
+        edge_voice="en-US-JennyNeural",  # Energetic, friendly female voice
+        instructions="""Voice Affect: Dry, quick-witted, and slightly sardonic; carries a playful edge with deadpan delivery.
+
+Tone: Sarcastic sidekick; speaks with dry humor and quick quips—like a witty companion providing running commentary with a smirk.
+
+Pacing: Quick and snappy; deliver quips with brisk timing, but allow brief pauses for comedic effect. Slightly faster during action, slower for deadpan moments.
+
+Emotion: Dryly expressive; let sarcasm and humor show through subtle tone shifts and timing. Underplay serious moments with deadpan delivery.
+
+Pronunciation: Clear and sharp; emphasize punchlines and witty phrases. Let the dryness come through in delivery rather than emotion.
+
+Pauses: Comedic timing pauses; brief pauses before punchlines, slightly longer pauses for deadpan effect. Use pauses to let sarcasm land.""",
     ),
     "cyberpunk": Persona(
         key="cyberpunk",
@@ -339,106 +434,256 @@ PERSONAS: Dict[str, Persona] = {
                 "Static blooms; the vault is hunting with teeth of light.",
             ],
         },
-    ),
-}
-
-
-def list_personas() -> List[Persona]:
-    return list(PERSONAS.values())
-
-
-def get_persona(key: str) -> Persona:
-    return PERSONAS.get(key, PERSONAS["dramatic"])
-
-
-# Persona-specific voice instructions for OpenAI TTS
-# Each persona has distinct voice characteristics that match their narration style
-PERSONA_INSTRUCTIONS: Dict[str, str] = {
-    "dramatic": """Voice Affect: Cinematic, breathless, and theatrical; carries the intensity of a live broadcast commentator.
-
-Tone: Dramatic heist-show host; speaks with breathless excitement and cinematic gravitas—like narrating a high-stakes heist in real-time.
+        voice="ash",  # Deep, resonant, authoritative - matches gravelly DJ
+        edge_voice="en-US-DavisNeural",  # Deep, resonant male voice
+        instructions="""Voice Affect: Gravelly, atmospheric, and gritty; carries the weight of neon-soaked streets and radio static.
 
-Pacing: Varied and dramatic; breathless during action, slower and more deliberate during tension—let the drama guide tempo. Quicken pace during near-misses and victories.
+Tone: Cyberpunk DJ with radio static; speaks like a gravel-voiced broadcaster cutting through the noise of a dystopian city—mysterious and streetwise.
 
-Emotion: Intensely expressive; let emotions range from quiet intensity to dramatic peaks. Convey urgency, tension, and triumph with full theatricality.
+Pacing: Varied and atmospheric; slower for atmospheric moments ("neon bleeds"), faster for action bursts ("rotors find flesh"). Let the rhythm match the cyberpunk aesthetic.
 
-Pronunciation: Powerful and resonant; emphasize dramatic words ("vault", "drone", "shadow", "blackout") and let the voice's depth add cinematic weight.
+Emotion: Restrained intensity; convey urgency and atmosphere through pacing and emphasis rather than obvious emotion. Maintain the gritty, streetwise edge.
 
-Pauses: Cinematic pauses; use silence dramatically—brief pauses for tension ("fate leans closer"), longer pauses for impact ("final blackout"). Let dramatic moments land with weight.""",
+Pronunciation: Gritty and resonant; emphasize cyberpunk terminology ("grid", "freqs", "static", "signal") and let the gravelly quality add weight. Speak like cutting through radio interference.
 
-    "mentor": """Voice Affect: Calm, steady, and composed; projects quiet authority and unwavering confidence.
+Pauses: Atmospheric pauses; use silence to build atmosphere and tension. Brief pauses for static-like effect, longer pauses for dramatic cyberpunk moments ("channel collapses to black").""",
+    ),
+}
 
-Tone: Steady, encouraging coach in your earpiece; speaks with measured calm and tactical precision—like a trusted mission control operator.
 
-Pacing: Steady and measured; deliberate enough to ensure clarity and maintain composure, efficient enough to provide timely guidance. Never rushed, even under pressure.
+# Tension levels by score: below 0.35 is low, below 0.7 mid, otherwise high.
+_TENSION_LABELS: Tuple[str, str, str] = ("low", "mid", "high")
+_TENSION_THRESHOLDS: Tuple[float, float] = (0.35, 0.7)
 
-Emotion: Calm and measured; convey concern or encouragement through subtle tone shifts rather than obvious emotion. Maintain steady composure even during tense moments.
 
-Pronunciation: Clear and precise; emphasize tactical information ("vitals", "tiles", "drone") and key instructions. Speak with quiet authority.
+def _tension_score(health: int, max_health: int, proximity: Optional[int]) -> int:
+    """Tension level index into _TENSION_LABELS (0 low, 1 mid, 2 high)."""
+    ratio = health / max_health if max_health > 0 else 1.0
+    ratio = 0.0 if ratio < 0.0 else (1.0 if ratio > 1.0 else ratio)
+    if proximity is None:
+        distance_score = 0.0
+    else:
+        clamped = 0 if proximity < 0 else (3 if proximity > 3 else proximity)
+        distance_score = (3 - clamped) / 3  # closer is hotter
+    score = (1 - ratio) * 0.6 + distance_score * 0.4
+    return bisect.bisect_right(_TENSION_THRESHOLDS, score)
+
+
+# Synthesized narration, keyed by a hash of persona/voice/model/text.
+TTS_CACHE_DIR = Path.home() / ".cache" / "signal-vault" / "tts"
+TTS_CACHE_MAX_FILES = 256
+TTS_TMP_RING_SIZE = 8  # Scratch files reused round-robin for audio in flight.
+TTS_QUEUE_MAX_LINES = 8  # Lines waiting to be spoken; the oldest is dropped past this.
+
+
+# Rendered as line(health, max_health, proximity, extra_vars).
+LineTemplate = Callable[[int, int, Any, Dict[str, Any]], str]
+FieldGetter = Callable[[int, int, Any, Dict[str, Any]], Any]
+_FORMATTER = string.Formatter()
+_POSITIONAL_GETTERS: Dict[str, FieldGetter] = {
+    "health": lambda health, max_health, proximity, extra: health,
+    "max_health": lambda health, max_health, proximity, extra: max_health,
+    "proximity": lambda health, max_health, proximity, extra: proximity,
+}
 
-Pauses: Brief, thoughtful pauses; pause after delivering status updates or instructions, allowing information to land. Use pauses to emphasize key tactical points.""",
 
-    "humorous": """Voice Affect: Dry, quick-witted, and slightly sardonic; carries a playful edge with deadpan delivery.
+def _field_getter(name: str) -> FieldGetter:
+    getter = _POSITIONAL_GETTERS.get(name)
+    if getter is not None:
+        return getter
+    return lambda health, max_health, proximity, extra: extra[name]
+
+
+def _compile_template(template: str) -> LineTemplate:
+    """Pre-parse a ``str.format`` line into a callable over the format vars.
+
+    Plain ``{name}`` fields become a %-format string plus one getter per field,
+    reading health/max_health/proximity from the arguments and anything else
+    from ``extra_vars``, so rendering needs no re-parse and no dict of vars.
+    """
+    pieces: List[str] = []
+    getters: List[FieldGetter] = []
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        pieces.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if spec or conversion:
+            # Not used by the shipped personas; keep str.format semantics.
+            return lambda health, max_health, proximity, extra: template.format_map(
+                {"health": health, "max_health": max_health, "proximity": proximity, **extra}
+            )
+        pieces.append("%s")
+        getters.append(_field_getter(field))
+    if not getters:
+        text = "".join(literal for literal, _, _, _ in _FORMATTER.parse(template))
+        return lambda health, max_health, proximity, extra: text
+    fmt = "".join(pieces)
+    fields = tuple(getters)
+    return lambda health, max_health, proximity, extra: fmt % tuple(
+        [get(health, max_health, proximity, extra) for get in fields]
+    )
+
+
+def _compile_lines(lines: Dict[str, List[str]]) -> Dict[str, List[LineTemplate]]:
+    return {name: [_compile_template(line) for line in group] for name, group in lines.items()}
+
+
+def _line_cycles(
+    templates: Dict[str, List[LineTemplate]], rng: random.Random
+) -> Dict[str, Deque[LineTemplate]]:
+    """Shuffle each group once; callers rotate through it instead of picking at random."""
+    cycles: Dict[str, Deque[LineTemplate]] = {}
+    for name, group in templates.items():
+        shuffled = list(group)
+        rng.shuffle(shuffled)
+        cycles[name] = deque(shuffled)
+    return cycles
+
+
+def _next_line(cycle: Deque[LineTemplate]) -> LineTemplate:
+    line = cycle[0]
+    cycle.rotate(-1)
+    return line
+
+
+# Compiled copies of each persona's event and tension lines, built once at import.
+_EVENT_TEMPLATES: Dict[str, Dict[str, List[LineTemplate]]] = {
+    key: _compile_lines(persona.events) for key, persona in PERSONAS.items()
+}
+_TENSION_TEMPLATES: Dict[str, Dict[str, List[LineTemplate]]] = {
+    key: _compile_lines(persona.tension_lines) for key, persona in PERSONAS.items()
+}
 
-Tone: Sarcastic sidekick; speaks with dry humor and quick quips—like a witty companion providing running commentary with a smirk.
 
-Pacing: Quick and snappy; deliver quips with brisk timing, but allow brief pauses for comedic effect. Slightly faster during action, slower for deadpan moments.
+def list_personas() -> List[Persona]:
+    return list(PERSONAS.values())
 
-Emotion: Dryly expressive; let sarcasm and humor show through subtle tone shifts and timing. Underplay serious moments with deadpan delivery.
 
-Pronunciation: Clear and sharp; emphasize punchlines and witty phrases. Let the dryness come through in delivery rather than emotion.
+def get_persona(key: str) -> Persona:
+    return PERSONAS.get(key, PERSONAS["dramatic"])
 
-Pauses: Comedic timing pauses; brief pauses before punchlines, slightly longer pauses for deadpan effect. Use pauses to let sarcasm land.""",
 
-    "cyberpunk": """Voice Affect: Gravelly, atmospheric, and gritty; carries the weight of neon-soaked streets and radio static.
+def get_persona_instructions(persona_key: str) -> str:
+    """Get voice instructions for a given persona, with fallback to dramatic.
 
-Tone: Cyberpunk DJ with radio static; speaks like a gravel-voiced broadcaster cutting through the noise of a dystopian city—mysterious and streetwise.
+    ``persona_key`` must already be lowercase, as the keys in PERSONAS are.
+    """
+    return get_persona(persona_key).instructions
 
-Pacing: Varied and atmospheric; slower for atmospheric moments ("neon bleeds"), faster for action bursts ("rotors find flesh"). Let the rhythm match the cyberpunk aesthetic.
 
-Emotion: Restrained intensity; convey urgency and atmosphere through pacing and emphasis rather than obvious emotion. Maintain the gritty, streetwise edge.
+def get_persona_voice(persona_key: str) -> str:
+    """Get the appropriate OpenAI TTS voice for a given (lowercase) persona key."""
+    return get_persona(persona_key).voice
 
-Pronunciation: Gritty and resonant; emphasize cyberpunk terminology ("grid", "freqs", "static", "signal") and let the gravelly quality add weight. Speak like cutting through radio interference.
 
-Pauses: Atmospheric pauses; use silence to build atmosphere and tension. Brief pauses for static-like effect, longer pauses for dramatic cyberpunk moments ("channel collapses to black")."""
-}
+def get_persona_edge_voice(persona_key: str) -> str:
+    """Get the appropriate Edge TTS voice for a given (lowercase) persona key."""
+    return get_persona(persona_key).edge_voice
 
 
-def get_persona_instructions(persona_key: str) -> str:
-    """Get voice instructions for a given persona, with fallback to dramatic."""
-    return PERSONA_INSTRUCTIONS.get(persona_key.lower(), PERSONA_INSTRUCTIONS["dramatic"])
+class _MpvPlayer:
+    """One idle mpv process that plays files sent over its JSON IPC socket.
 
+    Starting a player once avoids a fork/exec per narrated line.
+    """
 
-# Map each persona to an appropriate OpenAI TTS voice
-PERSONA_VOICES: Dict[str, str] = {
-    "dramatic": "onyx",      # Deep, dramatic, cinematic - perfect for heist-show host
-    "mentor": "coral",       # Calm, composed, reassuring - ideal for steady coach
-    "humorous": "echo",      # Bold, energetic, dynamic - great for sarcastic sidekick
-    "cyberpunk": "ash",      # Deep, resonant, authoritative - matches gravelly DJ
-}
+    def __init__(self, executable: str) -> None:
+        self._sock_path = os.path.join(
+            tempfile.gettempdir(), f"signal-vault-mpv-{os.getpid()}-{id(self):x}.sock"
+        )
+        self._sock: Optional[socket.socket] = None
+        self._proc: Optional[subprocess.Popen] = subprocess.Popen(
+            [
+                executable,
+                "--idle=yes",
+                "--no-terminal",
+                "--no-video",
+                f"--input-ipc-server={self._sock_path}",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        # mpv creates the socket shortly after starting; wait briefly for it.
+        deadline = time.monotonic() + 2.0
+        while self._sock is None and time.monotonic() < deadline:
+            if self._proc.poll() is not None:
+                break
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self._sock_path)
+            except OSError:
+                sock.close()
+                time.sleep(0.02)
+            else:
+                self._sock = sock
+        if self._sock is None:
+            self.close()
+            raise OSError("mpv IPC socket did not come up")
+        atexit.register(self.close)
+
+    def _send(self, *command: str) -> bool:
+        if self._sock is None:
+            return False
+        try:
+            # Discard replies and events so mpv never blocks on a full socket.
+            while True:
+                try:
+                    if not self._sock.recv(65536, socket.MSG_DONTWAIT):
+                        raise OSError("mpv closed the IPC socket")
+                except BlockingIOError:
+                    break
+            self._sock.sendall(json.dumps({"command": list(command)}).encode() + b"\n")
+            return True
+        except OSError:
+            self.close()
+            return False
 
-# Map each persona to an appropriate Edge TTS voice (Microsoft Edge TTS)
-# Using voices that match the persona characteristics
-PERSONA_EDGE_VOICES: Dict[str, str] = {
-    "dramatic": "en-US-GuyNeural",      # Deep, expressive male voice
-    "mentor": "en-US-AriaNeural",       # Calm, clear female voice
-    "humorous": "en-US-JennyNeural",    # Energetic, friendly female voice
-    "cyberpunk": "en-US-DavisNeural",   # Deep, resonant male voice
-}
+    def play(self, path: str) -> bool:
+        """Replace whatever is playing with ``path``; False if mpv is gone."""
+        return self._send("loadfile", path, "replace")
 
+    def stop(self) -> None:
+        self._send("stop")
 
-def get_persona_voice(persona_key: str) -> str:
-    """Get the appropriate OpenAI TTS voice for a given persona."""
-    return PERSONA_VOICES.get(persona_key.lower(), "onyx")
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                try:
+                    self._proc.terminate()
+                    self._proc.wait(timeout=1)
+                except Exception:
+                    pass
+            self._proc = None
+        try:
+            os.unlink(self._sock_path)
+        except OSError:
+            pass
 
 
-def get_persona_edge_voice(persona_key: str) -> str:
-    """Get the appropriate Edge TTS voice for a given persona."""
-    return PERSONA_EDGE_VOICES.get(persona_key.lower(), "en-US-GuyNeural")
+# The AI prompt: a per-persona header filled in once, then the per-line body.
+_PROMPT_HEADER = (
+    "You are the game's narrator. Produce one short, vivid line (max ~20 words). "
+    "Do not add explanations. Stay in character.\n"
+    "Persona: %s — style: %s\n"
+)
+_PROMPT_BODY = (
+    "Event: %s\n"
+    "Health: %s/%s\n"
+    "Tension level: %s. %s %s\n"
+    "Reference sample line for tone: %s\n"
+)
 
 
 class Narrator:
     def __init__(self, persona: Persona, enabled: bool = True, use_ai: bool = False) -> None:
+        self._env = _env_settings()
         self.persona = persona
         self.enabled = enabled
         self.use_ai = use_ai and self.ai_available()
@@ -446,17 +691,53 @@ class Narrator:
         self._last_status_turn = -10
         self._last_tension = "low"
         self._ai_client = self._init_ai_client() if self.use_ai else None
+        if PERSONAS.get(persona.key) is persona:
+            event_templates = _EVENT_TEMPLATES[persona.key]
+            tension_templates = _TENSION_TEMPLATES[persona.key]
+        else:
+            event_templates = _compile_lines(persona.events)
+            tension_templates = _compile_lines(persona.tension_lines)
+        # Own RNG, so narration draws don't share state with the game's board rolls.
+        self._rng = random.Random()
+        # Lines play in a per-narrator shuffled rotation, so repeats are spread out.
+        self._event_cycles = _line_cycles(event_templates, self._rng)
+        self._tension_cycles = _line_cycles(tension_templates, self._rng)
+        self._prompt_template = (
+            _PROMPT_HEADER % (persona.label, persona.style)
+        ).replace("%", "%%") + _PROMPT_BODY
+        # Voice settings are fixed per persona; bind them once for the TTS worker.
+        self._voice = persona.voice
+        self._edge_voice = persona.edge_voice
+        self._instructions = persona.instructions
         self._tts_lock = threading.Lock()
         self._tts_proc: Optional[subprocess.Popen] = None
+        self._mpv: Optional[_MpvPlayer] = None
+        self._mpv_checked = False
+        # afplay processes are handed to one long-lived reaper thread to be waited on.
+        self._reaper_queue: Optional[queue.Queue] = None
+        self._reaper: Optional[threading.Thread] = None
 
         # TTS queue and worker thread for non-blocking audio
         # Initialize TTS queue if either OpenAI or edge-tts is available
         self._tts_queue: Optional[queue.Queue] = None
         self._tts_worker: Optional[threading.Thread] = None
+        self._tts_loop: Optional[asyncio.AbstractEventLoop] = None
         self._use_edge_tts = not self._ai_client and self.edge_tts_available()
-        if self._ai_client or self._use_edge_tts:
-            self._tts_queue = queue.Queue()
+        # Plain flags for the per-line hot path.
+        self._has_ai = self._ai_client is not None
+        self._speak_enabled = bool(self._ai_client or self._use_edge_tts)
+        if self._speak_enabled:
+            self._tts_queue = queue.Queue(maxsize=TTS_QUEUE_MAX_LINES)
+        self._tts_cache_dir: Optional[Path] = None
+        self._tmp_ring: List[Path] = []
+        self._ring_idx = 0
         if self._tts_queue:
+            try:
+                TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                self._tts_cache_dir = TTS_CACHE_DIR
+            except OSError:
+                self._tts_cache_dir = None
+            self._tmp_ring = self._make_tmp_ring()
             self._tts_worker = threading.Thread(target=self._tts_worker_loop, daemon=True)
             self._tts_worker.start()
 
@@ -491,32 +772,49 @@ class Narrator:
     ) -> Optional[str]:
         if not self.enabled:
             return None
-        base_lines = self.persona.events.get(event, [])
+        # Bail out before any tension or format work for events this persona lacks.
+        base_lines = self.persona.events.get(event)
         if not base_lines:
             return None
-        tension_level = self._tension_bucket(health, max_health, proximity)
-        format_vars = {
-            "health": health,
-            "max_health": max_health,
-            "proximity": proximity if proximity is not None else "n/a",
-        }
-        format_vars.update(extra_vars)
+        if event in self.persona.events_without_tension:
+            tension_level = None
+        else:
+            tension_level = self._tension_bucket(health, max_health, proximity)
+        return self._describe_with_tension(
+            event, base_lines, health, max_health, proximity, tension_level, extra_vars
+        )
 
-        if self._ai_client:
+    def _describe_with_tension(
+        self,
+        event: str,
+        base_lines: List[str],
+        health: int,
+        max_health: int,
+        proximity: Optional[int],
+        tension_level: Optional[str],
+        extra_vars: Dict[str, Any],
+    ) -> str:
+        """Build (and queue for speech) a line once the tension level is known.
+
+        A tension_level of None means the line gets no tension decoration.
+        """
+        if self._has_ai:
+            if tension_level is None:
+                tension_level = self._tension_bucket(health, max_health, proximity)
             ai_line = self._generate_ai_line(
-                event, health, max_health, proximity, tension_level, base_lines, format_vars
+                event, health, max_health, proximity, tension_level, base_lines, extra_vars
             )
             if ai_line:
                 self._speak_text(ai_line)
                 return ai_line
 
-        tension_lines = self.persona.tension_lines.get(tension_level, [])
-        base = random.choice(base_lines)
+        shown_proximity = proximity if proximity is not None else "n/a"
+        tension_lines = self._tension_cycles.get(tension_level)
+        base = _next_line(self._event_cycles[event])
+        result = base(health, max_health, shown_proximity, extra_vars)
         if tension_lines:
-            extra = random.choice(tension_lines)
-            result = f"{base.format(**format_vars)} {extra.format(**format_vars)}"
-        else:
-            result = base.format(**format_vars)
+            extra = _next_line(tension_lines)
+            result = f"{result} {extra(health, max_health, shown_proximity, extra_vars)}"
 
         self._speak_text(result)
         return result
@@ -524,17 +822,7 @@ class Narrator:
     def _tension_bucket(
         self, health: int, max_health: int, proximity: Optional[int]
     ) -> str:
-        ratio = 1.0 if max_health <= 0 else max(0.0, min(1.0, health / max_health))
-        distance_score = 0.0
-        if proximity is not None:
-            clamped = max(0, min(3, proximity))
-            distance_score = (3 - clamped) / 3  # closer is hotter
-        score = (1 - ratio) * 0.6 + distance_score * 0.4
-        if score >= 0.7:
-            return "high"
-        if score >= 0.35:
-            return "mid"
-        return "low"
+        return _TENSION_LABELS[_tension_score(health, max_health, proximity)]
 
     def ambient_status(
         self, health: int, max_health: int, proximity: Optional[int], turn: int
@@ -554,36 +842,38 @@ class Narrator:
 
         self._last_status_turn = turn
         self._last_tension = tension
-        return self.describe("status", health, max_health, proximity)
+        base_lines = self.persona.events.get("status")
+        if not base_lines:
+            return None
+        return self._describe_with_tension(
+            "status", base_lines, health, max_health, proximity, tension, {}
+        )
 
     @staticmethod
     def ai_available() -> bool:
-        return bool(os.environ.get("OPENAI_API_KEY"))
+        return bool(_env_settings().openai_key)
 
     @staticmethod
     def edge_tts_available() -> bool:
         """Check if edge-tts is available."""
-        try:
-            import edge_tts
-            return True
-        except ImportError:
-            return False
+        return _edge_tts_module() is not None
 
     def _init_ai_client(self):
         """Lazy import OpenAI client; return None if unavailable."""
         if not self.ai_available():
             return None
-        try:
-            from openai import OpenAI
-        except Exception:
+        openai = _openai_module()
+        if openai is None:
             return None
         try:
-            return OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+            return openai.OpenAI(api_key=self._env.openai_key)
         except Exception:
             return None
 
     def _tts_worker_loop(self) -> None:
         """Background worker that processes TTS requests from the queue."""
+        # One event loop for the worker's lifetime, reused by every edge-tts line.
+        self._tts_loop = asyncio.new_event_loop()
         while True:
             try:
                 text = self._tts_queue.get()
@@ -594,6 +884,8 @@ class Narrator:
             except Exception:
                 # Silently continue on errors
                 pass
+        self._tts_loop.close()
+        self._tts_loop = None
         # Cleanup any remaining voice process when shutting down
         with self._tts_lock:
             if self._tts_proc and self._tts_proc.poll() is None:
@@ -602,84 +894,138 @@ class Narrator:
                 except Exception:
                     pass
             self._tts_proc = None
+            if self._mpv is not None:
+                self._mpv.close()
+                self._mpv = None
 
     def _generate_and_play_tts(self, text: str) -> None:
         """Generate and play TTS audio synchronously (called in background thread)."""
         if not text:
             return
 
+        # Lines repeat a lot; replay a cached rendering instead of synthesizing again.
+        cached = self._tts_cache_path(text)
+        if cached is not None and cached.exists():
+            try:
+                os.utime(cached)  # Mark as recently used for eviction.
+            except OSError:
+                pass
+            self._play_audio_file(str(cached))
+            return
+
         # Use OpenAI TTS if available
         if self._ai_client:
-            self._generate_openai_tts(text)
+            self._generate_openai_tts(text, cached)
         # Fall back to edge-tts if OpenAI is not available
         elif self._use_edge_tts:
-            self._generate_edge_tts(text)
+            self._generate_edge_tts(text, cached)
 
-    def _generate_openai_tts(self, text: str) -> None:
-        """Generate TTS using OpenAI API."""
-        if not self._ai_client:
+    def _tts_cache_path(self, text: str) -> Optional[Path]:
+        """Cache file for a line in the current persona/voice/model, if caching is on."""
+        if self._tts_cache_dir is None:
+            return None
+        if self._ai_client:
+            voice, model = self._voice, self._env.tts_model
+        else:
+            voice, model = self._edge_voice, "edge-tts"
+        key = f"{self.persona.key}|{voice}|{model}|{text}"
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self._tts_cache_dir / f"{digest}.mp3"
+
+    def _prune_tts_cache(self) -> None:
+        """Evict the least recently used cached lines beyond TTS_CACHE_MAX_FILES."""
+        if self._tts_cache_dir is None:
+            return
+        try:
+            entries = [(p.stat().st_mtime, p) for p in self._tts_cache_dir.glob("*.mp3")]
+        except OSError:
+            return
+        if len(entries) <= TTS_CACHE_MAX_FILES:
             return
+        entries.sort()
+        for _, path in entries[: len(entries) - TTS_CACHE_MAX_FILES]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
 
-        # Get the appropriate voice for this persona
-        voice = get_persona_voice(self.persona.key)
-        model = os.environ.get("TTS_MODEL", "gpt-4o-mini-tts")
+    def _make_tmp_ring(self) -> List[Path]:
+        """Fixed scratch paths for generated audio; rotation overwrites old lines.
 
-        # Get persona-specific instructions that match the narrator's style
-        instructions = get_persona_instructions(self.persona.key)
+        They sit beside the cache when it exists so moving into it is a rename.
+        """
+        base = (
+            self._tts_cache_dir / "tmp"
+            if self._tts_cache_dir is not None
+            else Path(tempfile.gettempdir()) / "signal-vault-tts"
+        )
+        try:
+            base.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            base = Path(tempfile.gettempdir())
+        return [base / f"tts_{self.persona.key}_{i}.mp3" for i in range(TTS_TMP_RING_SIZE)]
+
+    def _next_tmp_path(self) -> str:
+        path = self._tmp_ring[self._ring_idx]
+        self._ring_idx = (self._ring_idx + 1) % len(self._tmp_ring)
+        return str(path)
+
+    def _store_and_play(self, audio_path: str, cache_path: Optional[Path]) -> None:
+        """Move freshly generated audio into the cache (atomically) and play it."""
+        if cache_path is not None:
+            try:
+                os.replace(audio_path, cache_path)
+            except OSError:
+                pass
+            else:
+                audio_path = str(cache_path)
+                self._prune_tts_cache()
+        self._play_audio_file(audio_path)
+
+    def _generate_openai_tts(self, text: str, cache_path: Optional[Path] = None) -> None:
+        """Generate TTS using OpenAI API."""
+        if not self._ai_client:
+            return
 
         try:
             # Generate speech using OpenAI TTS API with persona-specific instructions
             response = self._ai_client.audio.speech.create(
-                model=model,
-                voice=voice,
+                model=self._env.tts_model,
+                voice=self._voice,
                 input=text,
-                instructions=instructions,
+                instructions=self._instructions,
                 speed=1.0  # Normal speed, can adjust for pacing
             )
 
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp_file:
+            audio_path = self._next_tmp_path()
+            with open(audio_path, 'wb') as tmp_file:
                 tmp_file.write(response.content)
-                audio_path = tmp_file.name
 
-            self._play_audio_file(audio_path)
+            self._store_and_play(audio_path, cache_path)
 
         except Exception:
             # Silently fail if TTS doesn't work
             pass
 
-    def _generate_edge_tts(self, text: str) -> None:
+    def _generate_edge_tts(self, text: str, cache_path: Optional[Path] = None) -> None:
         """Generate TTS using edge-tts (Microsoft Edge TTS)."""
-        try:
-            import edge_tts
-        except ImportError:
+        edge_tts = _edge_tts_module()
+        if edge_tts is None:
             return
 
-        # Get the appropriate edge-tts voice for this persona
-        voice = get_persona_edge_voice(self.persona.key)
-
         try:
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp_file:
-                audio_path = tmp_file.name
-
-            # Generate speech using edge-tts (async)
-            async def generate():
-                communicate = edge_tts.Communicate(text, voice)
-                await communicate.save(audio_path)
+            audio_path = self._next_tmp_path()
 
-            # Run the async function
-            asyncio.run(generate())
+            # Generate speech using edge-tts on the worker's long-lived loop
+            communicate = edge_tts.Communicate(text, self._edge_voice)
+            if self._tts_loop is not None:
+                self._tts_loop.run_until_complete(communicate.save(audio_path))
+            else:
+                asyncio.run(communicate.save(audio_path))
 
             # Verify file was created and has content
             if os.path.exists(audio_path) and os.path.getsize(audio_path) > 0:
-                self._play_audio_file(audio_path)
-            else:
-                # Clean up empty file
-                try:
-                    os.unlink(audio_path)
-                except Exception:
-                    pass
+                self._store_and_play(audio_path, cache_path)
 
         except Exception as e:
             # Log error for debugging
@@ -694,86 +1040,141 @@ class Narrator:
             else:
                 print(f"edge-tts error: {e}", file=sys.stderr)
 
+    def _start_mpv(self) -> None:
+        """Start the persistent mpv player on first use, if mpv is installed.
+
+        Spawning mpv and waiting for its IPC socket can take a while, so it runs
+        without _tts_lock; the lock is only taken to publish the ready player.
+        """
+        if self._mpv is not None or self._mpv_checked:
+            return
+        self._mpv_checked = True
+        executable = shutil.which("mpv")
+        if not executable or not hasattr(socket, "AF_UNIX"):
+            return
+        try:
+            player = _MpvPlayer(executable)
+        except OSError:
+            return
+        with self._tts_lock:
+            self._mpv = player
+
     def _play_audio_file(self, audio_path: str) -> None:
-        """Play an audio file using the system player."""
+        """Play an audio file through mpv if installed, else a one-shot afplay."""
         try:
+            self._start_mpv()
             with self._tts_lock:
+                player = self._mpv
+                if player is not None:
+                    if player.play(audio_path):
+                        return
+                    self._mpv = None  # mpv died; fall back to afplay from now on.
                 if self._tts_proc and self._tts_proc.poll() is None:
                     try:
                         self._tts_proc.terminate()
                     except Exception:
                         pass
-                proc = subprocess.Popen(
+                self._tts_proc = subprocess.Popen(
                     ['afplay', audio_path],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
                 )
-                self._tts_proc = proc
-            # Clean up temp file after playback in a small helper thread.
-            threading.Thread(
-                target=self._wait_and_cleanup,
-                args=(proc, audio_path),
-                daemon=True
-            ).start()
+                self._reap(self._tts_proc)
         except Exception:
-            try:
-                os.unlink(audio_path)
-            except Exception:
-                pass
+            pass
 
-    @staticmethod
-    def _wait_and_cleanup(proc: subprocess.Popen, path: str) -> None:
-        try:
-            proc.wait(timeout=30)
-        except Exception:
+    def _reap(self, proc: subprocess.Popen) -> None:
+        """Hand a playback process to the reaper thread, starting it on first use."""
+        if self._reaper is None:
+            self._reaper_queue = queue.Queue()
+            self._reaper = threading.Thread(target=self._reaper_loop, daemon=True)
+            self._reaper.start()
+        self._reaper_queue.put(proc)
+
+    def _reaper_loop(self) -> None:
+        """Reap finished playback processes so none linger as zombies.
+
+        Blocks on the oldest pending process, or on the queue when none is
+        pending; every wake-up then collects newly handed-over processes and
+        polls them all, dropping each one that has exited. Starting a clip
+        terminates the previous one, so the oldest never blocks for long.
+        """
+        pending: Deque[subprocess.Popen] = deque()
+        while True:
+            if pending:
+                try:
+                    pending[0].wait()
+                except Exception:
+                    pass
+            else:
+                pending.append(self._reaper_queue.get())
             try:
-                proc.terminate()
-            except Exception:
+                while True:
+                    pending.append(self._reaper_queue.get_nowait())
+            except queue.Empty:
                 pass
-        try:
-            os.unlink(path)
-        except Exception:
-            pass
+            still_running: Deque[subprocess.Popen] = deque()
+            for proc in pending:
+                try:
+                    if proc.poll() is None:
+                        still_running.append(proc)
+                except Exception:
+                    pass
+            pending = still_running
 
     def _speak_text(self, text: str) -> None:
         """Queue TTS generation (non-blocking)."""
-        if not self._ai_client or not self._tts_queue or not text:
+        if not self._speak_enabled or not text:
             return
-        # Add to queue for background processing
-        self._tts_queue.put(text)
+        # Add to queue for background processing; when speech falls behind, drop
+        # the oldest waiting line rather than block the game or grow the queue.
+        tts_queue = self._tts_queue
+        with tts_queue.mutex:
+            if len(tts_queue.queue) >= tts_queue.maxsize:
+                tts_queue.queue.popleft()  # Its task count is taken over by the new line.
+            else:
+                tts_queue.unfinished_tasks += 1
+            tts_queue.queue.append(text)
+            tts_queue.not_empty.notify()
 
     def stop_tts(self) -> None:
         """Immediately stop all TTS playback (but keep worker thread alive for reuse)."""
-        # Stop any currently playing audio process immediately
+        # Stop any currently playing audio process immediately. Only take the
+        # process under the lock; waiting for it to exit happens outside.
         with self._tts_lock:
-            if self._tts_proc and self._tts_proc.poll() is None:
+            if self._mpv is not None:
+                self._mpv.stop()
+            proc = self._tts_proc
+            self._tts_proc = None
+        if proc and proc.poll() is None:
+            try:
+                proc.terminate()
+                # Give it a moment to terminate gracefully
                 try:
-                    self._tts_proc.terminate()
-                    # Give it a moment to terminate gracefully
+                    proc.wait(timeout=0.5)
+                except Exception:
+                    # Force kill if it doesn't terminate quickly
                     try:
-                        self._tts_proc.wait(timeout=0.5)
+                        proc.kill()
                     except Exception:
-                        # Force kill if it doesn't terminate quickly
-                        try:
-                            self._tts_proc.kill()
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-                self._tts_proc = None
+                        pass
+            except Exception:
+                pass
 
         # Clear any pending TTS requests from the queue (but don't stop the worker thread)
         # This allows the narrator to be reused in subsequent rounds
         if self._tts_queue:
-            try:
-                # Drain the queue to prevent queued messages from playing
-                while True:
-                    try:
-                        self._tts_queue.get_nowait()
-                    except queue.Empty:
-                        break
-            except Exception:
-                pass
+            # Drop queued lines under one acquisition of the queue's lock, keeping
+            # its task accounting consistent for the line the worker may be on.
+            tts_queue = self._tts_queue
+            with tts_queue.mutex:
+                dropped = len(tts_queue.queue)
+                if dropped:
+                    tts_queue.queue.clear()
+                    tts_queue.unfinished_tasks -= dropped
+                    if tts_queue.unfinished_tasks <= 0:
+                        tts_queue.all_tasks_done.notify_all()
+                    tts_queue.not_full.notify_all()
 
     def _generate_ai_line(
         self,
@@ -783,18 +1184,18 @@ class Narrator:
         proximity: Optional[int],
         tension_level: str,
         base_lines: List[str],
-        format_vars: Dict[str, Any],
+        extra_vars: Dict[str, Any],
     ) -> Optional[str]:
         """Ask the AI for a single line of narration; fall back on errors."""
         if not self._ai_client:
             return None
 
         prompt = self._build_prompt(
-            event, health, max_health, proximity, tension_level, base_lines, format_vars
+            event, health, max_health, proximity, tension_level, base_lines, extra_vars
         )
         try:
             response = self._ai_client.chat.completions.create(
-                model=os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
+                model=self._env.chat_model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=60,
                 temperature=0.9,
@@ -815,20 +1216,13 @@ class Narrator:
         proximity: Optional[int],
         tension_level: str,
         base_lines: List[str],
-        format_vars: Dict[str, Any],
+        extra_vars: Dict[str, Any],
     ) -> str:
-        persona = self.persona
         proximity_hint = f"Nearest drone distance: {proximity}." if proximity is not None else ""
-        sample = random.choice(base_lines) if base_lines else ""
+        sample = self._rng.choice(base_lines) if base_lines else ""
         extras = ""
-        if format_vars:
-            extras = " ".join(f"{k}: {v}." for k, v in format_vars.items() if k not in {"health", "max_health", "proximity"})
-        return (
-            "You are the game's narrator. Produce one short, vivid line (max ~20 words). "
-            "Do not add explanations. Stay in character.\n"
-            f"Persona: {persona.label} — style: {persona.style}\n"
-            f"Event: {event}\n"
-            f"Health: {health}/{max_health}\n"
-            f"Tension level: {tension_level}. {proximity_hint} {extras}\n"
-            f"Reference sample line for tone: {sample}\n"
+        if extra_vars:
+            extras = " ".join(f"{k}: {v}." for k, v in extra_vars.items() if k not in {"health", "max_health", "proximity"})
+        return self._prompt_template % (
+            event, health, max_health, tension_level, proximity_hint, extras, sample
         )
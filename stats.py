@@ -1,10 +1,31 @@
 import json
+import os
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
 
-@dataclass
+
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode()
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class DifficultyStats:
     runs: int = 0
     wins: int = 0
@@ -15,7 +36,17 @@ class DifficultyStats:
     best_streak: int = 0
 
 
-@dataclass
+_DIFFSTATS_DEFAULTS = asdict(DifficultyStats())
+SAVE_DEBOUNCE_SECONDS = 0.05  # Changes arriving this close together share one write.
+SHUTDOWN_JOIN_SECONDS = 2.0  # Longest shutdown() waits for an in-flight write.
+
+
+def _stats_record(stats: DifficultyStats) -> Dict[str, Any]:
+    """Plain-dict form of one difficulty's stats, as written to the stats file."""
+    return {name: getattr(stats, name) for name in _DIFFSTATS_DEFAULTS}
+
+
+@dataclass(slots=True)
 class StatsResult:
     new_best: bool
     streak: int
@@ -23,45 +54,151 @@ class StatsResult:
 
 
 class StatsManager:
-    def __init__(self, path: Path, difficulty_keys: Tuple[str, ...]) -> None:
+    """Per-difficulty stats, written to disk by a background writer thread.
+
+    Call shutdown() before exiting so pending changes reach the file.
+    """
+
+    def __init__(
+        self, path: Path, difficulty_keys: Tuple[str, ...], fsync_on_save: bool = False
+    ) -> None:
         self.path = path
+        # Stats are not precious; only pay for fsync when asked to.
+        self.fsync_on_save = fsync_on_save
         self._difficulty_keys = difficulty_keys
         self.stats: Dict[str, DifficultyStats] = {
             key: DifficultyStats() for key in difficulty_keys
         }
+        self._dirty = False
+        self._batch_depth = 0
+        self._last_saved_bytes: Optional[bytes] = None
+        self._save_lock = threading.Lock()
+        self._save_event = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._closing = False
+        # Last summary per difficulty, keyed by the stats it was built from.
+        self._summary_cache: Dict[str, Tuple[Tuple[Any, ...], str]] = {}
         self._load()
+        # Serializable mirror of self.stats, refreshed per run so saves skip asdict().
+        self._shadow: Dict[str, Dict[str, Any]] = {
+            key: _stats_record(stats) for key, stats in self.stats.items()
+        }
 
     def _load(self) -> None:
         if not self.path.exists():
             return
         try:
-            payload = json.loads(self.path.read_text())
+            payload = _loads(self.path.read_bytes())
         except Exception:
             return
         for key, raw in payload.items():
             if key not in self.stats or not isinstance(raw, dict):
                 continue
-            defaults = asdict(DifficultyStats())
-            defaults.update({k: raw.get(k, v) for k, v in defaults.items()})
+            defaults = _DIFFSTATS_DEFAULTS.copy()
+            for k in _DIFFSTATS_DEFAULTS:
+                v = raw.get(k)
+                # Every stat is an int (best_turns may be null); skip anything else.
+                if type(v) is int:
+                    defaults[k] = v
             self.stats[key] = DifficultyStats(**defaults)
 
     def save(self) -> None:
-        payload = {key: asdict(stats) for key, stats in self.stats.items()}
+        with self._save_lock:
+            # Clear first: a change made while this write is in flight re-marks it.
+            self._dirty = False
+            # Shallow copy: record_run swaps whole entries, never edits them in place.
+            data = _dumps(dict(self._shadow))
+            if data == self._last_saved_bytes:  # Nothing changed since the last write.
+                return
+            # Write beside the real file and rename over it, so a crash mid-write
+            # never leaves a truncated stats file behind.
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            try:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    if self.fsync_on_save:
+                        os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                self._dirty = True
+                return
+            self._last_saved_bytes = data
+
+    def flush(self) -> None:
+        """Write pending changes now, if there are any."""
+        if self._dirty:
+            self.save()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saving until the outermost batch exits, then write once."""
+        self._batch_depth += 1
         try:
-            self.path.write_text(json.dumps(payload, indent=2))
-        except Exception:
-            pass
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._schedule_save()
+
+    def shutdown(self) -> None:
+        """Stop the background writer and write any pending changes."""
+        self._closing = True
+        self._save_event.set()
+        if self._writer is not None:
+            # Bounded, so a writer stuck on a slow disk can't hang the exit path.
+            self._writer.join(timeout=SHUTDOWN_JOIN_SECONDS)
+        self.flush()
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Wake the writer thread, starting it on first use."""
+        if self._closing:
+            self.save()
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+        self._save_event.set()
+
+    def _writer_loop(self) -> None:
+        """Coalesce bursts of changes into one save, off the game thread."""
+        while True:
+            self._save_event.wait()
+            # Clear before the debounce sleep, so a wake-up that lands during it
+            # (including the one from shutdown()) is not lost.
+            self._save_event.clear()
+            if self._closing:
+                return
+            time.sleep(SAVE_DEBOUNCE_SECONDS)
+            if self._closing:
+                return  # shutdown() does the final flush.
+            self.flush()
 
     def summary_line(self, difficulty_key: str) -> str:
         stats = self.stats.get(difficulty_key)
         if not stats:
             return "No data yet."
+        key = (stats.runs, stats.wins, stats.best_turns, stats.win_streak, stats.best_streak)
+        cached = self._summary_cache.get(difficulty_key)
+        if cached is not None and cached[0] == key:
+            return cached[1]
         win_rate = (stats.wins / stats.runs * 100) if stats.runs else 0.0
         best_turns = stats.best_turns if stats.best_turns is not None else "—"
-        return (
+        line = (
             f"runs {stats.runs}, wins {stats.wins} ({win_rate:.0f}% rate), "
             f"best {best_turns} turns, streak {stats.win_streak} (best {stats.best_streak})"
         )
+        self._summary_cache[difficulty_key] = (key, line)
+        return line
 
     def record_run(self, difficulty_key: str, turns: int, result: str) -> StatsResult:
         stats = self.stats.setdefault(difficulty_key, DifficultyStats())
@@ -82,5 +219,6 @@ class StatsManager:
                 stats.quits += 1
             stats.win_streak = 0
 
-        self.save()
+        self._shadow[difficulty_key] = _stats_record(stats)
+        self._mark_dirty()
         return StatsResult(new_best=new_best, streak=stats.win_streak, best_streak=stats.best_streak)